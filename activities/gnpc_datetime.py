@@ -5,9 +5,15 @@ Convert date strings from Glacier National Park Conservancy format to a localize
 import calendar
 import re
 from datetime import datetime
-from zoneinfo import ZoneInfo
 
-from shared.datetime_utils import cross_platform_strftime
+from shared.datetime_utils import MOUNTAIN, cross_platform_strftime
+
+# Regular expression pattern to extract date and time components
+_DATE_RE = re.compile(
+    r"(?P<month>[A-Za-z]+) (?P<day>\d{1,2}), (?P<year>\d{4})\D*(?P<hour>\d{1,2}):(?P<minute>\d{2})"
+)
+# Full month name (lowercase) -> month number, matching strptime's %B
+_MONTHS = {name.lower(): num for num, name in enumerate(calendar.month_name) if name}
 
 
 def convert_gnpc_datetimes(date_string: str):
@@ -23,10 +29,7 @@ def convert_gnpc_datetimes(date_string: str):
     if not isinstance(date_string, str):
         return date_string
 
-    # Regular expression pattern to extract date and time components
-    pattern = r"(?P<month>[A-Za-z]+) (?P<day>\d{1,2}), (?P<year>\d{4})\D*(?P<hour>\d{1,2}):(?P<minute>\d{2})"
-
-    match = re.search(pattern, date_string)
+    match = _DATE_RE.search(date_string)
     if match:
         try:
             # Extract components from the regex match
@@ -37,8 +40,9 @@ def convert_gnpc_datetimes(date_string: str):
             minute = int(match.group("minute"))
 
             # Handle 12-hour to 24-hour time conversion
-            is_pm = "pm" in date_string.lower() or "p.m." in date_string.lower()
-            is_am = "am" in date_string.lower() or "a.m." in date_string.lower()
+            lowered = date_string.lower()
+            is_pm = "pm" in lowered or "p.m." in lowered
+            is_am = "am" in lowered or "a.m." in lowered
 
             if is_am:
                 if hour == 12:
@@ -48,7 +52,9 @@ def convert_gnpc_datetimes(date_string: str):
                 hour += 12
 
             # Validate month
-            month_num = datetime.strptime(month, "%B").month
+            month_num = _MONTHS.get(month.lower())
+            if month_num is None:
+                return date_string
 
             # Validate day for the specific month and year
             max_days = calendar.monthrange(year, month_num)[1]
@@ -59,7 +65,7 @@ def convert_gnpc_datetimes(date_string: str):
             dt = datetime(year, month_num, day, hour, minute)
 
             # Return localized datetime
-            return dt.replace(tzinfo=ZoneInfo("America/Denver"))
+            return dt.replace(tzinfo=MOUNTAIN)
 
         except (ValueError, TypeError):
             # Return original string if any conversion fails
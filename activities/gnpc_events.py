@@ -3,7 +3,7 @@ This module retrieves information about GNPC events by scraping the GNPC website
 """
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from requests.exceptions import RequestException
 
 from activities.gnpc_datetime import convert_gnpc_datetimes, datetime_to_string
@@ -12,6 +12,13 @@ from shared.retry import retry
 
 logger = get_logger(__name__)
 
+# Only event rows are needed; skip building the rest of the page tree.
+# Divi rows carry several classes ("et_pb_row et_pb_row_3"), and a plain
+# string only matches the strainer when it is the sole class.
+_EVENT_ROWS = SoupStrainer(
+    "div", attrs={"class": lambda v: bool(v) and "et_pb_row" in v.split()}
+)
+
 
 class GNPCError(Exception):
     """Base exception for GNPC-related errors"""
@@ -49,7 +56,9 @@ def scrape_events_page(url: str, event_type: str) -> list[dict[str, str]]:
         raise GNPCRequestError(f"Failed to access {url}: {e!s}") from e
 
     try:
-        soup = BeautifulSoup(r.content, "html.parser")
+        soup = BeautifulSoup(
+            r.content, "html.parser", parse_only=_EVENT_ROWS, from_encoding="utf-8"
+        )
         rows = soup.find_all("div", attrs={"class": "et_pb_row"})
         rows = [row for row in rows if row.find("h4")]
 
@@ -4,6 +4,7 @@ This module provides FTP functionalities including deleting old files and upload
 
 import contextlib
 import ftplib
+import socket
 from datetime import UTC, datetime, timedelta
 from ftplib import FTP
 
@@ -14,6 +15,49 @@ from shared.settings import get_settings
 logger = get_logger(__name__)
 
 _FTP_RETENTION_DAYS = 180
+# Larger than ftplib's 8 KiB default so image uploads need fewer send() calls
+_FTP_BLOCKSIZE = 64 * 1024
+# Socket timeout for control and data connections, so a stalled server
+# fails the upload instead of hanging the daily run
+_FTP_TIMEOUT_SECS = 30
+
+
+def _parse_ftp_time(value: str) -> datetime:
+    """Parse an FTP YYYYMMDDHHMMSS[.sss] timestamp (always UTC)."""
+    return datetime.strptime(value[:14], "%Y%m%d%H%M%S").replace(tzinfo=UTC)
+
+
+def _file_mtimes(ftp: FTP) -> list[tuple[str, datetime]]:
+    """
+    List regular files in the current directory with their modification times.
+
+    Uses a single MLSD round-trip when the server supports it, falling back
+    to NLST plus a SIZE/MDTM probe per entry otherwise. Entries whose
+    timestamp cannot be parsed are logged and skipped.
+    """
+    try:
+        stamps = [
+            (name, facts["modify"])
+            for name, facts in ftp.mlsd(facts=["type", "modify"])
+            if facts.get("type") == "file" and "modify" in facts
+        ]
+    except ftplib.error_perm:
+        logger.debug("MLSD not supported, falling back to NLST + MDTM")
+        stamps = []
+        for file in ftp.nlst():
+            try:
+                ftp.size(file)
+            except ftplib.error_perm:
+                continue
+            stamps.append((file, ftp.sendcmd("MDTM " + file)[4:]))
+
+    files = []
+    for name, stamp in stamps:
+        try:
+            files.append((name, _parse_ftp_time(stamp)))
+        except ValueError:
+            logger.warning("Skipping %s: unparseable modification time %r", name, stamp)
+    return files
 
 
 def delete_on_first(ftp: FTP) -> None:
@@ -28,24 +72,26 @@ def delete_on_first(ftp: FTP) -> None:
     if current_date.day == 1:
         logger.info("First of the month: deleting files over 6 months old.")
         six_months_ago = current_date - timedelta(days=_FTP_RETENTION_DAYS)
-        files = ftp.nlst()
 
         # Iterate through the files and delete those older than 6 months
-        for file in files:
-            try:
-                ftp.size(file)
-            except ftplib.error_perm:
-                continue
-
-            file_modification_date = ftp.sendcmd("MDTM " + file)
-            file_modification_date = datetime.strptime(
-                file_modification_date[4:], "%Y%m%d%H%M%S"
-            ).replace(tzinfo=UTC)
-
+        for file, file_modification_date in _file_mtimes(ftp):
             if file_modification_date < six_months_ago:
                 ftp.delete(file)
 
 
+def _enable_keepalive(sock: socket.socket | None) -> None:
+    """Turn on TCP keepalive so a silently dropped control connection is detected."""
+    if sock is None:
+        return
+    with contextlib.suppress(OSError):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        # Per-connection tuning, set when the platform exposes them
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+
+
 class FTPSession:
     """Reusable FTP session that holds one connection open
     for multiple uploads."""
@@ -56,20 +102,30 @@ class FTPSession:
 
     def __enter__(self) -> "FTPSession":
         settings = get_settings()
-        self._ftp = FTP(settings.FTP_SERVER)  # noqa: S321
+        self._ftp = FTP(settings.FTP_SERVER, timeout=_FTP_TIMEOUT_SECS)  # noqa: S321
+        _enable_keepalive(getattr(self._ftp, "sock", None))
         self._ftp.login(settings.FTP_USERNAME, settings.FTP_PASSWORD)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         if self._ftp:
-            with contextlib.suppress(OSError, *ftplib.all_errors):
+            try:
                 self._ftp.quit()
+            except ftplib.all_errors:
+                # QUIT failed (e.g. dead connection) — drop the socket anyway
+                with contextlib.suppress(OSError):
+                    self._ftp.close()
             self._ftp = None
 
     def upload(
         self, directory: str, filename: str, file: str | None = None
     ) -> tuple[str, list[str]]:
-        """Upload a file reusing the existing connection. Runs delete_on_first once per directory."""
+        """Upload a file reusing the existing connection. Runs delete_on_first once per directory.
+
+        Returns the public URL and, when called without ``file``, the
+        directory listing. After an upload the listing is not re-fetched;
+        ``[filename]`` is returned instead to save an NLST round-trip.
+        """
         if self._ftp is None:
             raise RuntimeError("FTPSession must be used as a context manager")
 
@@ -83,14 +139,25 @@ class FTPSession:
             if file:
                 temp_filename = f"{filename}.tmp"
                 with open(file, "rb") as f:
-                    self._ftp.storbinary("STOR " + temp_filename, f)
+                    self._ftp.storbinary(
+                        "STOR " + temp_filename, f, blocksize=_FTP_BLOCKSIZE
+                    )
                 self._ftp.rename(temp_filename, filename)
-
-            files = self._ftp.nlst()
-            url = f"https://glacier.org/daily/{directory}/{filename}" if file else ""
-        except Exception as e:
+                files = [filename]
+                url = f"https://glacier.org/daily/{directory}/{filename}"
+            else:
+                files = self._ftp.nlst()
+                url = ""
+        except ftplib.all_errors as e:
             logger.error("Failed upload %s: %s", filename, e)
             files = []
             url = ""
+        except Exception:
+            # This is the per-file error boundary for serve_api; anything
+            # unexpected (e.g. a non-UTF-8 name in a listing) fails only this
+            # file, with a traceback, instead of the whole publish.
+            logger.exception("Unexpected error uploading %s", filename)
+            files = []
+            url = ""
 
         return url, files
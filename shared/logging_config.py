@@ -3,7 +3,8 @@ Centralized logging configuration for the Glacier Daily Update system.
 
 This module provides environment-aware logging configuration that:
 - Uses console logging for development
-- Uses file logging with rotation for production
+- Uses file logging with rotation for production (in-process, or external
+  via logrotate when LOG_ROTATION="external")
 - Adds a stderr handler at ERROR level in production (triggers cron emails)
 - Injects run_id into every log record for correlation
 - Reads environment type from the ENVIRONMENT variable
@@ -16,10 +17,16 @@ import re
 import sys
 from pathlib import Path
 
-from shared.run_context import RunIdFilter
+from shared.run_context import install_run_id_factory
 
 MAX_LOG_LINES = 500
 LOG_BACKUP_COUNT = 5
+LOG_FILE = "logs/glacier_daily.log"
+LOG_FORMAT = "%(asctime)s - [%(run_id)s] %(name)s - %(levelname)s - %(message)s"
+LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
+# WatchedFileHandler relies on POSIX inode semantics; elsewhere the
+# rotating handler is used even when LOG_ROTATION="external".
+_EXTERNAL_ROTATION_SUPPORTED = os.name == "posix"
 
 # Matches email addresses while avoiding false positives on version strings
 # like package@1.2.3 by requiring a 2+ letter TLD.
@@ -28,6 +35,35 @@ _EMAIL_RE = re.compile(
 )
 
 
+class RunLogFormatter(logging.Formatter):
+    """Formatter for the fixed run log format.
+
+    Produces the same output as ``logging.Formatter(LOG_FORMAT, LOG_DATEFMT)``
+    but builds the line directly instead of going through the generic
+    ``%``-style dispatch for every record.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(fmt=LOG_FORMAT, datefmt=LOG_DATEFMT)
+
+    def format(self, record: logging.LogRecord) -> str:
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record, self.datefmt)
+        run_id = getattr(record, "run_id", "no-run")
+        s = f"{record.asctime} - [{run_id}] {record.name} - {record.levelname} - {record.message}"
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if s[-1:] != "\n":
+                s += "\n"
+            s += record.exc_text
+        if record.stack_info:
+            if s[-1:] != "\n":
+                s += "\n"
+            s += self.formatStack(record.stack_info)
+        return s
+
+
 class RunLogCapture(logging.Handler):
     """In-memory handler that captures formatted log lines for the run report."""
 
@@ -36,15 +72,16 @@ class RunLogCapture(logging.Handler):
         self.buffer: list[str] = []
 
     def emit(self, record: logging.LogRecord) -> None:
+        # Once the buffer is full, skip formatting and redaction entirely —
+        # the line would be dropped anyway.
+        if len(self.buffer) > MAX_LOG_LINES:
+            return
+        if len(self.buffer) == MAX_LOG_LINES:
+            self.buffer.append(f"... (log capture truncated at {MAX_LOG_LINES} lines)")
+            return
         try:
             line = self.format(record)
-            line = _EMAIL_RE.sub("[email redacted]", line)
-            if len(self.buffer) < MAX_LOG_LINES:
-                self.buffer.append(line)
-            elif len(self.buffer) == MAX_LOG_LINES:
-                self.buffer.append(
-                    f"... (log capture truncated at {MAX_LOG_LINES} lines)"
-                )
+            self.buffer.append(_EMAIL_RE.sub("[email redacted]", line))
         except Exception:
             self.handleError(record)
 
@@ -83,34 +120,44 @@ def setup_logging() -> None:
     # Clear any existing handlers
     root_logger.handlers.clear()
 
-    # Filter that injects run_id into every record — must be added to each
-    # handler (not the root logger) because logger-level filters only run on
-    # the originating logger, not on parents during propagation.
-    run_id_filter = RunIdFilter()
+    # Stamp run_id on every record as it is created, so handlers need no
+    # per-record filter dispatch.
+    install_run_id_factory()
 
     # Create formatter with run_id
-    formatter = logging.Formatter(
-        fmt="%(asctime)s - [%(run_id)s] %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    formatter = RunLogFormatter()
 
     if environment == "production":
-        # Production: Log to rotating file (INFO+)
-        file_handler = logging.handlers.RotatingFileHandler(
-            filename="logs/glacier_daily.log",
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=LOG_BACKUP_COUNT,
-        )
+        # Production: Log to file (INFO+). With LOG_ROTATION="external" the
+        # file is rotated by logrotate instead of in-process, e.g.:
+        #
+        #   /path/to/glacier_daily/logs/glacier_daily.log {
+        #       size 10M
+        #       rotate 5
+        #       missingok
+        #       notifempty
+        #   }
+        #
+        # WatchedFileHandler reopens the file when logrotate moves it.
+        # Read from the environment like ENVIRONMENT above, so logging comes
+        # up even when required Settings keys are missing.
+        file_handler: logging.FileHandler
+        if os.getenv("LOG_ROTATION") == "external" and _EXTERNAL_ROTATION_SUPPORTED:
+            file_handler = logging.handlers.WatchedFileHandler(LOG_FILE)
+        else:
+            file_handler = logging.handlers.RotatingFileHandler(
+                filename=LOG_FILE,
+                maxBytes=10 * 1024 * 1024,  # 10MB
+                backupCount=LOG_BACKUP_COUNT,
+            )
         file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(formatter)
-        file_handler.addFilter(run_id_filter)
         root_logger.addHandler(file_handler)
 
         # Production: Also log ERROR+ to stderr (triggers cron emails)
         stderr_handler = logging.StreamHandler(sys.stderr)
         stderr_handler.setLevel(logging.ERROR)
         stderr_handler.setFormatter(formatter)
-        stderr_handler.addFilter(run_id_filter)
         root_logger.addHandler(stderr_handler)
 
     else:
@@ -118,14 +165,12 @@ def setup_logging() -> None:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.DEBUG)
         console_handler.setFormatter(formatter)
-        console_handler.addFilter(run_id_filter)
         root_logger.addHandler(console_handler)
 
     # In-memory capture for run reports (both environments)
     global _log_capture
     capture = RunLogCapture()
     capture.setFormatter(formatter)
-    capture.addFilter(run_id_filter)
     root_logger.addHandler(capture)
     _log_capture = capture
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import uuid
 from datetime import datetime
+from typing import Any
 
 from shared.datetime_utils import now_mountain
 
@@ -42,10 +43,20 @@ def reset_run() -> None:
     _current_run = None
 
 
-class RunIdFilter(logging.Filter):
-    """Logging filter that injects run_id into every log record."""
+_base_record_factory = logging.getLogRecordFactory()
 
-    def filter(self, record: logging.LogRecord) -> bool:
-        ctx = get_run()
-        record.run_id = ctx.run_id if ctx else "no-run"
-        return True
+
+def _run_id_record_factory(*args: Any, **kwargs: Any) -> logging.LogRecord:
+    """LogRecord factory that stamps run_id at record construction time."""
+    record = _base_record_factory(*args, **kwargs)
+    record.run_id = _current_run.run_id if _current_run else "no-run"
+    return record
+
+
+def install_run_id_factory() -> None:
+    """Install the run_id LogRecord factory. Safe to call more than once."""
+    global _base_record_factory
+    current = logging.getLogRecordFactory()
+    if current is not _run_id_record_factory:
+        _base_record_factory = current
+        logging.setLogRecordFactory(_run_id_record_factory)
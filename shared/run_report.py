@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 import os
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import timedelta
 from typing import Any
 
@@ -37,7 +38,22 @@ class RunReport:
     log_lines: list[str] = field(default_factory=list)
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Shallow on purpose: every field is a primitive or a container of
+        # primitives, so asdict()'s recursive copy buys nothing.
+        return {
+            "run_id": self.run_id,
+            "run_type": self.run_type,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration_seconds": self.duration_seconds,
+            "environment": self.environment,
+            "modules": self.modules,
+            "subscriber_count": self.subscriber_count,
+            "email_delivery": self.email_delivery,
+            "errors": self.errors,
+            "overall_status": self.overall_status,
+            "log_lines": self.log_lines,
+        }
 
     def to_json(self) -> str:
         return json.dumps(self.to_dict(), indent=2, default=str)
@@ -112,11 +128,12 @@ def upload_status_report(report: RunReport) -> None:
     """
     # Load existing history from local file
     runs: list[dict] = []
+    previous = ""
     if os.path.exists(STATUS_FILE):
         try:
             with open(STATUS_FILE, encoding="utf-8") as f:
-                data = json.load(f)
-            runs = data.get("runs", [])
+                previous = f.read()
+            runs = json.loads(previous).get("runs", [])
         except (json.JSONDecodeError, OSError):
             runs = []
 
@@ -127,11 +144,26 @@ def upload_status_report(report: RunReport) -> None:
     cutoff = (now_mountain() - timedelta(days=HISTORY_DAYS)).isoformat()
     runs = [r for r in runs if r.get("end_time", "") >= cutoff]
 
-    # Write and upload
-    status_data = {"runs": runs}
+    # Write and upload, skipping the write if nothing changed (e.g. the
+    # current run was itself trimmed as stale)
+    status_json = json.dumps({"runs": runs}, indent=2, default=str)
+    if status_json == previous:
+        logger.info("Status report unchanged, skipping write")
+        return
+    # Write to a temp file and swap it in so a crash mid-write never leaves
+    # a truncated status.json (which would discard the history next run).
+    # No fsync: the content is regenerated every run.
     os.makedirs(os.path.dirname(STATUS_FILE) or ".", exist_ok=True)
-    with open(STATUS_FILE, "w", encoding="utf-8") as f:
-        json.dump(status_data, f, indent=2, default=str)
+    tmp_file = f"{STATUS_FILE}.tmp"
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            f.write(status_json)
+        os.replace(tmp_file, STATUS_FILE)
+    except Exception:
+        # Don't leave a half-written temp file next to status.json
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_file)
+        raise
 
     # status.json is served from the server/ directory via the public API endpoint
     logger.info("Status report written (%d runs in history)", len(runs))
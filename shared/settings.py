@@ -49,6 +49,7 @@ class Settings:
     FTP_SERVER: str = "ftp.glacier.org"
     ENVIRONMENT: str = "development"
     DRIP_CAMPAIGN_ID: str = "169298893"
+    LOG_ROTATION: str = "internal"
 
     # --- Optional: Cloudflare ---
     CACHE_PURGE: str = ""
@@ -78,9 +79,10 @@ class Settings:
         fields = dataclasses.fields(cls)
         kwargs: dict[str, str] = {}
         missing: list[str] = []
+        env = os.environ
 
         for f in fields:
-            env_val = os.environ.get(f.name)
+            env_val = env.get(f.name)
 
             if f.default is not dataclasses.MISSING:
                 # Optional field — use env value if non-empty, else default.
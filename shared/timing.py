@@ -101,10 +101,10 @@ def timed(name: str) -> Callable:
             root = logging.getLogger()
             root.addHandler(capture)
             token = _active_capture.set(capture)
-            start = time.monotonic()
+            start = time.perf_counter_ns()
             try:
                 result = func(*args, **kwargs)
-                elapsed = time.monotonic() - start
+                elapsed = (time.perf_counter_ns() - start) / 1e9
                 if capture.records:
                     error_msgs = "; ".join(r.getMessage() for r in capture.records)
                     logger.info("%s completed in %.2fs (with warnings)", name, elapsed)
@@ -127,7 +127,7 @@ def timed(name: str) -> Callable:
                     )
                 return result
             except Exception as e:
-                elapsed = time.monotonic() - start
+                elapsed = (time.perf_counter_ns() - start) / 1e9
                 logger.error("%s failed after %.2fs: %s", name, elapsed, e)
                 get_timing().record(
                     ModuleResult(
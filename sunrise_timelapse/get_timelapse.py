@@ -2,14 +2,26 @@
 Select the best thumbnail frame from the timelapse video.
 """
 
+import functools
+import threading
+
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from shared.context_executor import ContextAwareExecutor
 from shared.datetime_utils import now_mountain
 from shared.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+TIMELAPSE_HOST = "http://timelapse.glacierconservancy.org"
+TIMELAPSE_CACHE = ".timelapse_cache"
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+
 class TimelapseError(Exception):
     """Base exception for timelapse processing errors."""
 
@@ -22,6 +34,41 @@ class FileOperationError(TimelapseError):
     """Exception raised for file operation errors."""
 
 
+# process_video() fetches both indexes from worker threads, and
+# functools.cache does not stop two cold callers from each building a session
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests_cache.CachedSession:
+    """Return the shared session, creating it once even under concurrent calls."""
+    with _session_lock:
+        return _build_session()
+
+
+@functools.cache
+def _build_session() -> requests_cache.CachedSession:
+    """Shared session so both index requests reuse pooled connections.
+
+    Responses are stored but expire immediately, so every fetch is a
+    conditional request (If-None-Match / If-Modified-Since) that the
+    server can answer with an empty 304 when the index hasn't changed.
+    """
+    session = requests_cache.CachedSession(
+        TIMELAPSE_CACHE, expire_after=requests_cache.EXPIRE_IMMEDIATELY
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=2,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    # Ask intermediate caches to revalidate with the origin; this replaces
+    # the old per-request cache-buster query string
+    session.headers.update({"User-Agent": USER_AGENT, "Pragma": "no-cache"})
+    return session
+
+
 def fetch_glacier_data(endpoint_type: str) -> list:
     """
     Fetch data from glacier.org JSON endpoints.
@@ -42,17 +89,13 @@ def fetch_glacier_data(endpoint_type: str) -> list:
         return []
 
     try:
-        cache_buster = str(int(now_mountain().timestamp()))
         filename = endpoint_map[endpoint_type]
-        url = f"http://timelapse.glacierconservancy.org/{filename}?{cache_buster}"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
+        url = f"{TIMELAPSE_HOST}/{filename}"
 
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _get_session().get(url, timeout=10)
         response.raise_for_status()
         return response.json()
-    except Exception as e:
+    except (requests.RequestException, ValueError) as e:
         logger.error("Error fetching %s data: %s", endpoint_type, e)
         return []
 
@@ -124,19 +167,16 @@ def find_matching_thumbnail(video_id: str, thumbnail_data: list) -> str | None:
         video_date_part = video_id.replace("_sunrise_timelapse", "")
         expected_thumbnail = f"{video_date_part}_sunrise.jpg"
 
-        # Skip the first entry which is just the date
-        thumbnail_entries = [
-            entry
-            for entry in thumbnail_data
-            if isinstance(entry, dict) and "path" in entry
-        ]
-
-        for entry in thumbnail_entries:
-            thumbnail_path = entry.get("path", "")
-            if expected_thumbnail in thumbnail_path:
-                return f"https://glacier.org{thumbnail_path}"
+        # Index paths by filename (skipping the first entry, which is just
+        # the date); the first entry wins if a filename appears twice
+        thumbnail_index: dict[str, str] = {}
+        for entry in thumbnail_data:
+            if isinstance(entry, dict) and "path" in entry:
+                path = entry["path"]
+                thumbnail_index.setdefault(path.rsplit("/", 1)[-1], path)
 
-        return None
+        thumbnail_path = thumbnail_index.get(expected_thumbnail)
+        return f"https://glacier.org{thumbnail_path}" if thumbnail_path else None
 
     except Exception as e:
         logger.error("Error finding matching thumbnail: %s", e)
@@ -152,9 +192,12 @@ def process_video() -> tuple[str, str, str]:
         Returns ("", "", "") if any error occurs.
     """
     try:
-        # Fetch remote data
-        timelapse_data = fetch_glacier_data("timelapse")
-        thumbnail_data = fetch_glacier_data("thumbnails")
+        # Fetch both remote indexes concurrently
+        with ContextAwareExecutor(max_workers=2) as executor:
+            timelapse_future = executor.submit(fetch_glacier_data, "timelapse")
+            thumbnail_future = executor.submit(fetch_glacier_data, "thumbnails")
+            timelapse_data = timelapse_future.result()
+            thumbnail_data = thumbnail_future.result()
 
         if not timelapse_data or not thumbnail_data:
             logger.warning("Failed to fetch remote timelapse data")
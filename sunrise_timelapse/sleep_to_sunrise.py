@@ -2,12 +2,13 @@
 Calculate when the sunrise timelapse will be finished and sleep until that time.
 """
 
-from datetime import date, datetime, timedelta
-from time import sleep
-from zoneinfo import ZoneInfo
+import threading
+from datetime import date, timedelta
+from functools import lru_cache
 
 from astral import LocationInfo, sun
 
+from shared.datetime_utils import now_mountain
 from shared.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -15,24 +16,31 @@ logger = get_logger(__name__)
 MAX_WAIT_SECONDS = 3 * 60 * 60  # 3 hours
 SUNRISE_BUFFER_MINUTES = 52
 
+# Set by cancel_sleep() to wake sleep_time() early
+_wake = threading.Event()
+
+# West Glacier LI object
+_WEST_GLACIER = LocationInfo(
+    name="west glacier",
+    region="MT",
+    timezone="US/Mountain",
+    latitude=48.4950,
+    longitude=-113.9811,
+)
+
+
+@lru_cache(maxsize=8)
+def _sun_times(day: date) -> dict:
+    """Sun events at West Glacier for a given day (fixed per day, so cached)."""
+    return sun.sun(_WEST_GLACIER.observer, date=day, tzinfo=_WEST_GLACIER.timezone)
+
 
 def sunrise_timelapse_complete_time():
     """
     Calculate the sunrise time and add SUNRISE_BUFFER_MINUTES minutes.
     """
-    # Create West Glacier LI object
-    wg = LocationInfo(
-        name="west glacier",
-        region="MT",
-        timezone="US/Mountain",
-        latitude=48.4950,
-        longitude=-113.9811,
-    )
-
-    # Create West Glacier sun object
-    s = sun.sun(wg.observer, date=date.today(), tzinfo=wg.timezone)
-
-    now = datetime.now(tz=ZoneInfo("America/Denver"))
+    now = now_mountain()
+    s = _sun_times(now.date())
 
     # Sunrise time minus now plus buffer for timelapse completion
     timelapse_ready_in = s["sunrise"] - now + timedelta(minutes=SUNRISE_BUFFER_MINUTES)
@@ -58,7 +66,18 @@ def sleep_time():
             "Waiting %d minutes for timelapse to finish.",
             round(timelapse_ready_in / 60),
         )
-        sleep(timelapse_ready_in)
+        # Clear only after waking so a cancel_sleep() issued before the
+        # wait began is still honoured
+        if _wake.wait(timeout=timelapse_ready_in):
+            logger.info("Sleep cancelled before timelapse completion time.")
+        _wake.clear()
+
+
+def cancel_sleep() -> None:
+    """
+    Wake a thread blocked in sleep_time() so it continues immediately.
+    """
+    _wake.set()
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -1,3 +1,4 @@
+import types
 from datetime import datetime
 from unittest.mock import Mock, patch
 from zoneinfo import ZoneInfo
@@ -12,6 +13,9 @@ from activities.gnpc_events import (
     scrape_events_page,
 )
 from shared.data_types import EventsResult
+from shared.datetime_utils import MOUNTAIN
+
+PACIFIC = ZoneInfo("America/Los_Angeles")
 
 
 @pytest.fixture
@@ -31,11 +35,18 @@ def _make_nps_event(title, location, timestart, timeend, event_id="ABC123"):
     }
 
 
+def _response(text="", json_data=None):
+    """Lightweight stand-in for a successful requests.Response."""
+    return types.SimpleNamespace(
+        status_code=200,
+        content=text.encode("utf-8"),
+        raise_for_status=lambda: None,
+        json=lambda: json_data,
+    )
+
+
 def _make_nps_response(events):
-    mock_resp = Mock()
-    mock_resp.raise_for_status = Mock()
-    mock_resp.json.return_value = {"data": events, "total": str(len(events))}
-    return mock_resp
+    return _response(json_data={"data": events, "total": str(len(events))})
 
 
 def test_activity_retrieval(mock_nps_api):
@@ -67,7 +78,7 @@ def test_no_activities_no_message(mock_nps_api):
 def test_no_activities_season_concluded(mock_nps_api):
     """Test that late fall dates return season concluded message."""
     mock_nps_api.return_value = _make_nps_response([])
-    result = events_today(f"{datetime.now().year}-12-05")
+    result = events_today("2024-12-05")
     assert isinstance(result, EventsResult)
     assert "concluded" in result.seasonal_message.lower()
 
@@ -75,7 +86,7 @@ def test_no_activities_season_concluded(mock_nps_api):
 def test_no_activities_season_not_started(mock_nps_api):
     """Test that early spring dates return season not started message."""
     mock_nps_api.return_value = _make_nps_response([])
-    result = events_today(f"{datetime.now().year}-04-05")
+    result = events_today("2024-04-05")
     assert isinstance(result, EventsResult)
     assert "not started" in result.seasonal_message.lower()
 
@@ -109,37 +120,40 @@ def test_events_today_no_events_summer(mock_nps_api):
     assert "no ranger programs today" in result.seasonal_message.lower()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mst_timezone():
-    return ZoneInfo("America/Denver")
+    return MOUNTAIN
+
+
+# (GNPC date string, expected localized datetime) pairs
+SAMPLE_DATES = (
+    # Standard format
+    ("July 15, 2024 7:30", datetime(2024, 7, 15, 19, 30, tzinfo=MOUNTAIN)),
+    # Single digit day
+    ("August 5, 2024 8:00", datetime(2024, 8, 5, 20, 0, tzinfo=MOUNTAIN)),
+    # Different month
+    ("December 25, 2024 6:45", datetime(2024, 12, 25, 18, 45, tzinfo=MOUNTAIN)),
+    # Different minutes
+    ("January 1, 2024 7:05", datetime(2024, 1, 1, 19, 5, tzinfo=MOUNTAIN)),
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_dates():
-    return [
-        # Standard format
-        ("July 15, 2024 7:30", datetime(2024, 7, 15, 19, 30)),
-        # Single digit day
-        ("August 5, 2024 8:00", datetime(2024, 8, 5, 20, 0)),
-        # Different month
-        ("December 25, 2024 6:45", datetime(2024, 12, 25, 18, 45)),
-        # Different minutes
-        ("January 1, 2024 7:05", datetime(2024, 1, 1, 19, 5)),
-    ]
+    return SAMPLE_DATES
 
 
-def test_convert_gnpc_datetimes_valid_dates(sample_dates, mst_timezone):
+@pytest.mark.parametrize("date_string, expected", SAMPLE_DATES)
+def test_convert_gnpc_datetimes_valid_dates(date_string, expected):
     """Test conversion of valid date strings."""
-    for date_string, expected_dt in sample_dates:
-        result = convert_gnpc_datetimes(date_string)
-        expected = expected_dt.replace(tzinfo=mst_timezone)
-        assert result == expected
-        assert result.tzinfo == expected.tzinfo
+    result = convert_gnpc_datetimes(date_string)
+    assert result == expected
+    assert result.tzinfo == expected.tzinfo
 
 
-def test_convert_gnpc_datetimes_invalid_format():
-    """Test handling of invalid date string formats."""
-    invalid_dates = [
+@pytest.mark.parametrize(
+    "invalid_date",
+    [
         "Not a date",
         "15 July, 2024 7:30",  # Wrong order
         "July 15 2024 7:30",  # Missing comma
@@ -147,35 +161,40 @@ def test_convert_gnpc_datetimes_invalid_format():
         "July 15, 2024 7",  # Incomplete time
         "",  # Empty string
         "July 32, 2024 7:30",  # Invalid day
-    ]
+    ],
+)
+def test_convert_gnpc_datetimes_invalid_format(invalid_date):
+    """Invalid date string formats are returned unchanged."""
+    assert convert_gnpc_datetimes(invalid_date) == invalid_date
 
-    for invalid_date in invalid_dates:
-        result = convert_gnpc_datetimes(invalid_date)
-        assert (
-            result == invalid_date
-        )  # Should return original string for invalid formats
 
+def test_convert_gnpc_datetimes_month_names(mst_timezone):
+    """Month names match case-insensitively; abbreviations are rejected like %B."""
+    assert convert_gnpc_datetimes("JULY 15, 2024 7:30") == datetime(
+        2024, 7, 15, 19, 30, tzinfo=mst_timezone
+    )
+    assert convert_gnpc_datetimes("Jul 15, 2024 7:30") == "Jul 15, 2024 7:30"
 
-def test_convert_gnpc_datetimes_edge_cases(mst_timezone):
-    """Test edge cases for date conversion."""
-    edge_cases = [
+
+@pytest.mark.parametrize(
+    "date_string, expected",
+    [
         # Leap year
-        ("February 29, 2024 7:30", datetime(2024, 2, 29, 19, 30)),
+        ("February 29, 2024 7:30", datetime(2024, 2, 29, 19, 30, tzinfo=MOUNTAIN)),
         # Year boundaries
-        ("December 31, 2024 11:59", datetime(2024, 12, 31, 23, 59)),
+        ("December 31, 2024 11:59", datetime(2024, 12, 31, 23, 59, tzinfo=MOUNTAIN)),
         # Noon
-        ("January 1, 2024 12:00", datetime(2024, 1, 1, 12, 0)),
-    ]
-
-    for date_string, expected_dt in edge_cases:
-        result = convert_gnpc_datetimes(date_string)
-        expected = expected_dt.replace(tzinfo=mst_timezone)
-        assert result == expected
+        ("January 1, 2024 12:00", datetime(2024, 1, 1, 12, 0, tzinfo=MOUNTAIN)),
+    ],
+)
+def test_convert_gnpc_datetimes_edge_cases(date_string, expected):
+    """Test edge cases for date conversion."""
+    assert convert_gnpc_datetimes(date_string) == expected
 
 
 def test_datetime_to_string_standard():
     """Test standard datetime string formatting."""
-    tz = ZoneInfo("America/Denver")
+    tz = MOUNTAIN
     test_cases = [
         (
             datetime(2024, 7, 15, 19, 30, tzinfo=tz),
@@ -198,7 +217,7 @@ def test_datetime_to_string_standard():
 
 def test_datetime_to_string_single_digit_hours():
     """Test formatting of times with single-digit hours."""
-    tz = ZoneInfo("America/Denver")
+    tz = MOUNTAIN
     dt = datetime(2024, 7, 15, 9, 5, tzinfo=tz)
     result = datetime_to_string(dt)
     assert result == "Monday, July 15, 2024, 9:05 am MDT"
@@ -207,12 +226,10 @@ def test_datetime_to_string_single_digit_hours():
 def test_datetime_to_string_timezone_handling():
     """Test handling of different timezones."""
     # Create datetime in different timezone
-    pst = ZoneInfo("America/Los_Angeles")
-    dt_pst = datetime(2024, 7, 15, 18, 30, tzinfo=pst)
+    dt_pst = datetime(2024, 7, 15, 18, 30, tzinfo=PACIFIC)
 
     # Convert to MST/MDT
-    mst = ZoneInfo("America/Denver")
-    dt_mst = dt_pst.astimezone(mst)
+    dt_mst = dt_pst.astimezone(MOUNTAIN)
 
     result = datetime_to_string(dt_mst)
     assert result == "Monday, July 15, 2024, 7:30 pm MDT"
@@ -234,7 +251,7 @@ def test_convert_and_format_integration(sample_dates, mst_timezone):
         assert converted.tzinfo == reconverted.tzinfo
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_conversation_html():
     return """
     <div class="et_pb_row" id="event1">
@@ -247,7 +264,7 @@ def sample_conversation_html():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_book_club_html():
     return """
     <div class="et_pb_row" id="event2">
@@ -260,50 +277,108 @@ def sample_book_club_html():
     """
 
 
+CONVERSATIONS_URL = "https://glacier.org/glacier-conversations"
+BOOK_CLUB_URL = "https://glacier.org/glacier-book-club"
+
+
 @pytest.fixture
-def mock_response(sample_conversation_html):
-    mock_resp = Mock()
-    mock_resp.status_code = 200
-    mock_resp.content = sample_conversation_html
-    return mock_resp
+def gnpc_pages(monkeypatch):
+    """Route requests.get by URL.
 
+    Tests fill the returned dict with a response, or an exception to raise,
+    per URL. Retry backoff is disabled so failures resolve immediately.
+    """
+    pages = {}
 
-def test_scrape_events_page_success(mock_response):
-    with patch("requests.get", return_value=mock_response):
-        events = scrape_events_page(
-            "https://glacier.org/glacier-conversations", "Glacier Conversation:"
-        )
+    def fake_get(url, **kwargs):
+        page = pages[url]
+        if isinstance(page, Exception):
+            raise page
+        return page
 
-        assert len(events) == 1
-        assert events[0]["title"] == "Glacier Conversation: Sample Event Title"
-        assert events[0]["pic"] == "https://example.com/thumb.jpg"
-        assert events[0]["datetime"] == "January 15, 2024 7:30"
+    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr("shared.retry.sleep", lambda _: None)
+    return pages
 
 
-def test_scrape_events_page_request_error():
-    with (
-        patch("requests.get", side_effect=requests.RequestException("Network error")),
-        patch("shared.retry.sleep"),
-    ):
-        result = scrape_events_page(
-            "https://glacier.org/glacier-conversations", "Glacier Conversation:"
-        )
-        assert result == []
+def test_scrape_events_page_success(gnpc_pages, sample_conversation_html):
+    gnpc_pages[CONVERSATIONS_URL] = _response(sample_conversation_html)
+    events = scrape_events_page(CONVERSATIONS_URL, "Glacier Conversation:")
 
+    assert len(events) == 1
+    assert events[0]["title"] == "Glacier Conversation: Sample Event Title"
+    assert events[0]["pic"] == "https://example.com/thumb.jpg"
+    assert events[0]["datetime"] == "January 15, 2024 7:30"
 
-def test_scrape_events_page_invalid_html():
-    mock_resp = Mock()
-    mock_resp.status_code = 200
-    mock_resp.content = "Invalid HTML"
 
-    with patch("requests.get", return_value=mock_resp):
-        events = scrape_events_page(
-            "https://glacier.org/glacier-conversations", "Glacier Conversation:"
-        )
-        assert events == []
+def test_scrape_events_page_ignores_markup_outside_rows(gnpc_pages):
+    """Only et_pb_row divs are parsed; surrounding page markup is skipped."""
+    html = """
+    <html><body>
+    <header><h4>Site Navigation</h4><p>Menu: Home</p><p>x</p></header>
+    <div class="et_pb_section">
+        <div class="et_pb_row" id="event1">
+            <h4>Nested Event</h4>
+            <p>January 15, 2024 7:30</p>
+            <p>Description</p>
+            <p>Register</p>
+        </div>
+    </div>
+    </body></html>
+    """
+    gnpc_pages[CONVERSATIONS_URL] = _response(html)
+    events = scrape_events_page(CONVERSATIONS_URL, "Glacier Conversation:")
+
+    assert [e["title"] for e in events] == ["Glacier Conversation: Nested Event"]
+    assert events[0]["registration"].endswith("#event1")
 
 
-def test_scrape_events_page_missing_elements():
+def test_scrape_events_page_multi_class_rows(gnpc_pages):
+    """Rows carrying extra Divi classes alongside et_pb_row are still found."""
+    html = """
+    <div class="et_pb_section">
+        <div class="et_pb_row et_pb_row_3" id="event1">
+            <h4>Mountain Goats</h4>
+            <p>January 15, 2024 7:30</p>
+            <p>Description</p>
+            <p>Register</p>
+        </div>
+    </div>
+    """
+    gnpc_pages[CONVERSATIONS_URL] = _response(html)
+    events = scrape_events_page(CONVERSATIONS_URL, "Glacier Conversation:")
+
+    assert [e["title"] for e in events] == ["Glacier Conversation: Mountain Goats"]
+
+
+def test_scrape_events_page_decodes_utf8(gnpc_pages):
+    """Response bytes are decoded as UTF-8 without charset sniffing."""
+    html = """
+    <div class="et_pb_row" id="event1">
+        <h4>Café Talk — Pikas</h4>
+        <p>January 15, 2024 7:30</p>
+        <p>Description</p>
+        <p>Register</p>
+    </div>
+    """
+    gnpc_pages[CONVERSATIONS_URL] = _response(html)
+    events = scrape_events_page(CONVERSATIONS_URL, "Glacier Conversation:")
+    assert events[0]["title"] == "Glacier Conversation: Café Talk — Pikas"
+
+
+def test_scrape_events_page_request_error(gnpc_pages):
+    gnpc_pages[CONVERSATIONS_URL] = requests.RequestException("Network error")
+    result = scrape_events_page(CONVERSATIONS_URL, "Glacier Conversation:")
+    assert result == []
+
+
+def test_scrape_events_page_invalid_html(gnpc_pages):
+    gnpc_pages[CONVERSATIONS_URL] = _response("Invalid HTML")
+    events = scrape_events_page(CONVERSATIONS_URL, "Glacier Conversation:")
+    assert events == []
+
+
+def test_scrape_events_page_missing_elements(gnpc_pages):
     """Test handling of HTML with missing required elements"""
     html = """
     <div class='et_pb_row'>
@@ -313,76 +388,52 @@ def test_scrape_events_page_missing_elements():
         <p>Register</p>
     </div>
     """
-    mock_resp = Mock()
-    mock_resp.status_code = 200
-    mock_resp.content = html
+    gnpc_pages[CONVERSATIONS_URL] = _response(html)
+    events = scrape_events_page(CONVERSATIONS_URL, "Glacier Conversation:")
 
-    with patch("requests.get", return_value=mock_resp):
-        events = scrape_events_page(
-            "https://glacier.org/glacier-conversations", "Glacier Conversation:"
-        )
-        assert len(events) == 1
-        assert events[0]["pic"] == ""  # Should have empty string for missing image
-        assert events[0]["title"] == "Glacier Conversation: Title"
+    assert len(events) == 1
+    assert events[0]["pic"] == ""  # Should have empty string for missing image
+    assert events[0]["title"] == "Glacier Conversation: Title"
 
 
-def test_scrape_events_page_completely_missing_elements():
+def test_scrape_events_page_completely_missing_elements(gnpc_pages):
     """Test handling of HTML with no usable event data"""
-    html = "<div class='et_pb_row'><h4>Title</h4></div>"
-    mock_resp = Mock()
-    mock_resp.status_code = 200
-    mock_resp.content = html
+    gnpc_pages[CONVERSATIONS_URL] = _response(
+        "<div class='et_pb_row'><h4>Title</h4></div>"
+    )
+    events = scrape_events_page(CONVERSATIONS_URL, "Glacier Conversation:")
+    assert events == []  # Should return empty list when no valid events found
 
-    with patch("requests.get", return_value=mock_resp):
-        events = scrape_events_page(
-            "https://glacier.org/glacier-conversations", "Glacier Conversation:"
-        )
-        assert events == []  # Should return empty list when no valid events found
 
+def test_get_gnpc_events_success(
+    gnpc_pages, sample_conversation_html, sample_book_club_html
+):
+    gnpc_pages[CONVERSATIONS_URL] = _response(sample_conversation_html)
+    gnpc_pages[BOOK_CLUB_URL] = _response(sample_book_club_html)
+    events = get_gnpc_events()
 
-def test_get_gnpc_events_success(sample_conversation_html, sample_book_club_html):
-    mock_responses = {
-        "https://glacier.org/glacier-conversations": Mock(
-            status_code=200, content=sample_conversation_html
-        ),
-        "https://glacier.org/glacier-book-club": Mock(
-            status_code=200, content=sample_book_club_html
-        ),
-    }
+    assert len(events) == 2
+    assert any("Glacier Conversation:" in event["title"] for event in events)
+    assert any("Glacier Book Club:" in event["title"] for event in events)
 
-    def mock_get(url, **kwargs):
-        return mock_responses[url]
 
-    with patch("requests.get", side_effect=mock_get):
-        events = get_gnpc_events()
+def test_get_gnpc_events_partial_failure(gnpc_pages, sample_conversation_html):
+    gnpc_pages[CONVERSATIONS_URL] = _response(sample_conversation_html)
+    gnpc_pages[BOOK_CLUB_URL] = requests.RequestException("Network error")
+    events = get_gnpc_events()
 
-        assert len(events) == 2
-        assert any("Glacier Conversation:" in event["title"] for event in events)
-        assert any("Glacier Book Club:" in event["title"] for event in events)
+    assert len(events) == 1
+    assert "Glacier Conversation:" in events[0]["title"]
 
 
-def test_get_gnpc_events_partial_failure(sample_conversation_html):
-    def mock_get(url, **kwargs):
-        if "conversations" in url:
-            return Mock(status_code=200, content=sample_conversation_html)
-        raise requests.RequestException("Network error")
+def test_get_gnpc_events_all_failures(gnpc_pages):
+    gnpc_pages[CONVERSATIONS_URL] = requests.RequestException("Network error")
+    gnpc_pages[BOOK_CLUB_URL] = requests.RequestException("Network error")
+    events = get_gnpc_events()
+    assert events == []
 
-    with patch("requests.get", side_effect=mock_get), patch("shared.retry.sleep"):
-        events = get_gnpc_events()
-        assert len(events) == 1
-        assert "Glacier Conversation:" in events[0]["title"]
 
-
-def test_get_gnpc_events_all_failures():
-    with (
-        patch("requests.get", side_effect=requests.RequestException("Network error")),
-        patch("shared.retry.sleep"),
-    ):
-        events = get_gnpc_events()
-        assert events == []
-
-
-def test_get_gnpc_events_invalid_date():
+def test_get_gnpc_events_invalid_date(gnpc_pages):
     html = """
     <div class="et_pb_row" id="event1">
         <h4>Sample Event</h4>
@@ -392,14 +443,13 @@ def test_get_gnpc_events_invalid_date():
         <p>Register</p>
     </div>
     """
-    mock_resp = Mock(status_code=200, content=html)
-
-    with patch("requests.get", return_value=mock_resp):
-        events = get_gnpc_events()
-        assert events == []
+    gnpc_pages[CONVERSATIONS_URL] = _response(html)
+    gnpc_pages[BOOK_CLUB_URL] = _response(html)
+    events = get_gnpc_events()
+    assert events == []
 
 
-def test_event_sorting():
+def test_event_sorting(gnpc_pages):
     html1 = """
     <div class="et_pb_row" id="event1">
         <h4>Later Event</h4>
@@ -418,16 +468,10 @@ def test_event_sorting():
         <p>Register</p>
     </div>
     """
+    gnpc_pages[CONVERSATIONS_URL] = _response(html1)
+    gnpc_pages[BOOK_CLUB_URL] = _response(html2)
+    events = get_gnpc_events()
 
-    mock_responses = {
-        "https://glacier.org/glacier-conversations": Mock(
-            status_code=200, content=html1
-        ),
-        "https://glacier.org/glacier-book-club": Mock(status_code=200, content=html2),
-    }
-
-    with patch("requests.get", side_effect=lambda url, **kwargs: mock_responses[url]):
-        events = get_gnpc_events()
-        assert len(events) == 2
-        assert "January" in events[0]["datetime"]
-        assert "March" in events[1]["datetime"]
+    assert len(events) == 2
+    assert "January" in events[0]["datetime"]
+    assert "March" in events[1]["datetime"]
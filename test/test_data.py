@@ -2,7 +2,7 @@
 Module for testing the data generation function.
 """
 
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -16,66 +16,8 @@ from shared.data_types import (
     TrailsResult,
 )
 
-
-@pytest.fixture
-def generated_data():
-    """Fixture to provide generated data for tests."""
-    from unittest.mock import Mock
-
-    # Create a mock WeatherContent object
-    mock_weather = Mock()
-    mock_weather.message1 = "weather1"
-    mock_weather.message2 = "weather2"
-    mock_weather.season = "season"
-    mock_weather.results = []
-
-    # Mock all the external dependencies to avoid real API calls and file access
-    with (
-        patch(
-            "generate_and_upload.events_today",
-            return_value=EventsResult(seasonal_message="mocked events"),
-        ),
-        patch("generate_and_upload.get_gnpc_events", return_value=[]),
-        patch(
-            "generate_and_upload.get_image_otd",
-            return_value=("img_url", "title", "link"),
-        ),
-        patch(
-            "generate_and_upload.get_notices",
-            return_value=NoticesResult(notices=["mocked notice"]),
-        ),
-        patch(
-            "generate_and_upload.peak",
-            return_value=("Peak Name - 8000 ft.", "peak_img", "peak_map"),
-        ),
-        patch(
-            "generate_and_upload.get_product",
-            return_value=("Product", "img", "link", "desc"),
-        ),
-        patch(
-            "generate_and_upload.get_hiker_biker_status",
-            return_value=HikerBikerResult(),
-        ),
-        patch("generate_and_upload.get_road_status", return_value=RoadsResult()),
-        patch(
-            "generate_and_upload.process_video", return_value=("vid", "still", "str")
-        ),
-        patch(
-            "generate_and_upload.get_campground_status",
-            return_value=CampgroundsResult(statuses=["campground status"]),
-        ),
-        patch("generate_and_upload.get_closed_trails", return_value=TrailsResult()),
-        patch("generate_and_upload.weather_data", return_value=mock_weather),
-        patch("generate_and_upload.weather_image", return_value="weather_img_url"),
-    ):
-        data, _ = gen_data()
-        return data
-
-
-@pytest.fixture
-def expected_keys():
-    """Fixture to provide the set of expected keys."""
-    return {
+EXPECTED_KEYS = frozenset(
+    {
         "date",
         "today",
         "events",
@@ -99,12 +41,11 @@ def expected_keys():
         "sunrise_vid",
         "sunrise_still",
     }
+)
 
-
-@pytest.fixture
-def required_truthy_keys():
-    """Fixture to provide keys that must have truthy values."""
-    return {
+# Keys that must have truthy values
+REQUIRED_TRUTHY_KEYS = frozenset(
+    {
         "date",
         "today",
         "weather",
@@ -119,18 +60,54 @@ def required_truthy_keys():
         "product_desc",
         "image_otd",
     }
+)
+
+
+@pytest.fixture
+def generated_data():
+    """Fixture to provide generated data for tests."""
+    # Create a mock WeatherContent object
+    mock_weather = Mock()
+    mock_weather.message1 = "weather1"
+    mock_weather.message2 = "weather2"
+    mock_weather.season = "season"
+    mock_weather.results = []
+
+    # Mock all the external dependencies to avoid real API calls and file access.
+    # Every target lives in generate_and_upload, so one patch.multiple covers them.
+    sources = {
+        "events_today": EventsResult(seasonal_message="mocked events"),
+        "get_gnpc_events": [],
+        "get_image_otd": ("img_url", "title", "link"),
+        "get_notices": NoticesResult(notices=["mocked notice"]),
+        "peak": ("Peak Name - 8000 ft.", "peak_img", "peak_map"),
+        "get_product": ("Product", "img", "link", "desc"),
+        "get_hiker_biker_status": HikerBikerResult(),
+        "get_road_status": RoadsResult(),
+        "process_video": ("vid", "still", "str"),
+        "get_campground_status": CampgroundsResult(statuses=["campground status"]),
+        "get_closed_trails": TrailsResult(),
+        "weather_data": mock_weather,
+        "weather_image": "weather_img_url",
+    }
+    with patch.multiple(
+        "generate_and_upload",
+        **{name: Mock(return_value=value) for name, value in sources.items()},
+    ):
+        data, _ = gen_data()
+        return data
 
 
-def test_gen_data_keys(generated_data, expected_keys):
+def test_gen_data_keys(generated_data):
     """Test that the generated data contains all the expected keys."""
-    missing_keys = expected_keys - set(generated_data.keys())
+    missing_keys = EXPECTED_KEYS - generated_data.keys()
     assert not missing_keys, f"Missing required keys: {missing_keys}"
 
 
-def test_truthy_values(generated_data, required_truthy_keys):
+def test_truthy_values(generated_data):
     """Test that specific keys have truthy values."""
     non_truthy_keys = {
-        key for key in required_truthy_keys if not generated_data.get(key)
+        key for key in REQUIRED_TRUTHY_KEYS if not generated_data.get(key)
     }
     assert not non_truthy_keys, (
         f"Following keys have non-truthy values: {non_truthy_keys}"
@@ -8,11 +8,11 @@ correctly on both Unix and Windows platforms.
 import platform
 from datetime import UTC, datetime
 from unittest.mock import patch
-from zoneinfo import ZoneInfo
 
 import pytest
 
 from shared.datetime_utils import (
+    MOUNTAIN,
     cross_platform_strftime,
     format_date_readable,
     format_short_date,
@@ -98,35 +98,20 @@ class TestCrossPlatformStrftime:
 class TestFormatTime12hr:
     """Test the format_time_12hr function."""
 
-    def test_morning_time(self):
-        """Test morning time formatting."""
-        dt = datetime(2025, 1, 5, 9, 30, 0)
-        result = format_time_12hr(dt)
-        assert result == "9:30 am"
-
-    def test_afternoon_time(self):
-        """Test afternoon time formatting."""
-        dt = datetime(2025, 1, 5, 15, 45, 0)
-        result = format_time_12hr(dt)
-        assert result == "3:45 pm"
-
-    def test_midnight(self):
-        """Test midnight formatting."""
-        dt = datetime(2025, 1, 5, 0, 0, 0)
-        result = format_time_12hr(dt)
-        assert result == "12:00 am"
-
-    def test_noon(self):
-        """Test noon formatting."""
-        dt = datetime(2025, 1, 5, 12, 0, 0)
-        result = format_time_12hr(dt)
-        assert result == "12:00 pm"
-
-    def test_single_digit_hour(self):
-        """Test single digit hour (no leading zero)."""
-        dt = datetime(2025, 1, 5, 1, 5, 0)
-        result = format_time_12hr(dt)
-        assert result == "1:05 am"
+    @pytest.mark.parametrize(
+        "hour, minute, expected",
+        [
+            pytest.param(9, 30, "9:30 am", id="morning"),
+            pytest.param(15, 45, "3:45 pm", id="afternoon"),
+            pytest.param(0, 0, "12:00 am", id="midnight"),
+            pytest.param(12, 0, "12:00 pm", id="noon"),
+            pytest.param(1, 5, "1:05 am", id="single_digit_hour"),
+        ],
+    )
+    def test_format_time_12hr(self, hour, minute, expected):
+        """Hours have no leading zero and a lowercase am/pm suffix."""
+        dt = datetime(2025, 1, 5, hour, minute, 0)
+        assert format_time_12hr(dt) == expected
 
 
 class TestFormatDateReadable:
@@ -166,13 +151,13 @@ class TestFormatTimeWithTimezone:
 
     def test_timezone_formatting(self):
         """Test time with timezone formatting."""
-        dt = datetime(2025, 1, 5, 13, 30, 0, tzinfo=ZoneInfo("America/Denver"))
+        dt = datetime(2025, 1, 5, 13, 30, 0, tzinfo=MOUNTAIN)
         result = format_time_with_timezone(dt)
         assert result == "1:30 pm MST"
 
     def test_timezone_formatting_summer(self):
         """Test time with timezone formatting in summer (MDT)."""
-        dt = datetime(2025, 7, 15, 13, 30, 0, tzinfo=ZoneInfo("America/Denver"))
+        dt = datetime(2025, 7, 15, 13, 30, 0, tzinfo=MOUNTAIN)
         result = format_time_with_timezone(dt)
         assert result == "1:30 pm MDT"
 
@@ -186,41 +171,39 @@ class TestFormatTimeWithTimezone:
 class TestWindowsSpecificBehavior:
     """Test Windows-specific datetime formatting behavior."""
 
-    @patch("shared.datetime_utils.platform.system", return_value="Windows")
-    def test_windows_leading_zero_removal(self, mock_system):
-        """Test that leading zeros are properly removed on Windows."""
-        dt = datetime(2025, 1, 5, 1, 5, 0)
+    @pytest.fixture(autouse=True)
+    def _windows(self):
+        with patch("shared.datetime_utils.platform.system", return_value="Windows"):
+            yield
 
-        # Test various %-modifiers
-        test_cases = [
+    @pytest.mark.parametrize(
+        "format_str, expected",
+        [
             ("%-d", "5"),  # day
             ("%-I", "1"),  # hour (12-hour)
             ("%-m", "1"),  # month
             ("%-y", "25"),  # year without century
-        ]
-
-        for format_str, expected in test_cases:
-            result = cross_platform_strftime(dt, format_str)
-            assert result == expected, f"Failed for format {format_str}"
-
-    @patch("shared.datetime_utils.platform.system", return_value="Windows")
-    def test_windows_no_leading_zero_needed(self, mock_system):
-        """Test Windows behavior when no leading zero removal is needed."""
-        dt = datetime(2025, 12, 15, 11, 45, 0)
+        ],
+    )
+    def test_windows_leading_zero_removal(self, format_str, expected):
+        """Test that leading zeros are properly removed on Windows."""
+        dt = datetime(2025, 1, 5, 1, 5, 0)
+        assert cross_platform_strftime(dt, format_str) == expected
 
-        # Test cases where values are already double-digit
-        test_cases = [
+    @pytest.mark.parametrize(
+        "format_str, expected",
+        [
             ("%-d", "15"),  # day
             ("%-I", "11"),  # hour (12-hour)
             ("%-m", "12"),  # month
-        ]
-
-        for format_str, expected in test_cases:
-            result = cross_platform_strftime(dt, format_str)
-            assert result == expected, f"Failed for format {format_str}"
+        ],
+    )
+    def test_windows_no_leading_zero_needed(self, format_str, expected):
+        """Test Windows behavior when no leading zero removal is needed."""
+        dt = datetime(2025, 12, 15, 11, 45, 0)
+        assert cross_platform_strftime(dt, format_str) == expected
 
-    @patch("shared.datetime_utils.platform.system", return_value="Windows")
-    def test_windows_zero_values(self, mock_system):
+    def test_windows_zero_values(self):
         """Test Windows behavior with values that would become empty after lstrip('0')."""
         # This is an edge case where stripping all zeros would leave empty string
         # Our function should handle this by returning '0'
@@ -236,7 +219,7 @@ class TestRealWorldUseCases:
 
     def test_gnpc_datetime_format(self):
         """Test the format used in gnpc_datetime module."""
-        dt = datetime(2025, 1, 5, 13, 30, 0, tzinfo=ZoneInfo("America/Denver"))
+        dt = datetime(2025, 1, 5, 13, 30, 0, tzinfo=MOUNTAIN)
         result = (
             cross_platform_strftime(dt, "%A, %B %-d, %Y, %-I:%M %p %Z")
             .lower()
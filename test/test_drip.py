@@ -10,10 +10,20 @@ import drip.subscriber_list as subscriber_list
 import drip.update_subscriber as update_subscriber
 
 
-def _set_drip_env(monkeypatch):
-    """Helper to set the Drip env vars used by tests."""
-    monkeypatch.setenv("DRIP_TOKEN", "t")
-    monkeypatch.setenv("DRIP_ACCOUNT", "a")
+def _response(status_code, payload=None):
+    """Build a stand-in for a requests.Response with a JSON body."""
+    body = payload if payload is not None else {}
+    return types.SimpleNamespace(status_code=status_code, json=lambda: body)
+
+
+def _recording_post(sink, status_code=201, payload=None):
+    """Return a fake requests.post that records each call's kwargs into ``sink``."""
+
+    def post(url, headers, data, timeout):
+        sink.append({"url": url, "data": data, "timeout": timeout})
+        return _response(status_code, payload)
+
+    return post
 
 
 # --- scheduled_subs.py ---
@@ -59,34 +69,21 @@ def test_update_scheduled_subs_logic(monkeypatch):
 
 # --- update_subscriber.py ---
 def test_update_subscriber_success(monkeypatch, mock_required_settings):
-    class FakeResponse:
-        status_code = 200
-
-        def json(self):
-            return {}
-
     monkeypatch.setattr(
         update_subscriber,
         "requests",
-        types.SimpleNamespace(post=lambda *a, **k: FakeResponse()),
+        types.SimpleNamespace(post=lambda *a, **k: _response(200)),
     )
-    _set_drip_env(monkeypatch)
     update_subscriber.update_subscriber({"email": "test@example.com"})
 
 
 def test_update_subscriber_failure(monkeypatch, mock_required_settings):
-    class FakeResponse:
-        status_code = 400
-
-        def json(self):
-            return {"errors": [{"code": "bad", "message": "fail"}]}
-
+    failure = _response(400, {"errors": [{"code": "bad", "message": "fail"}]})
     monkeypatch.setattr(
         update_subscriber,
         "requests",
-        types.SimpleNamespace(post=lambda *a, **k: FakeResponse()),
+        types.SimpleNamespace(post=lambda *a, **k: failure),
     )
-    _set_drip_env(monkeypatch)
     update_subscriber.update_subscriber({"email": "fail@example.com"})
 
 
@@ -103,43 +100,25 @@ def test_get_subs_merges(monkeypatch):
 
 
 def test_bulk_workflow_trigger(monkeypatch, mock_required_settings):
-    called = {}
-
-    def fake_post(url, headers, data, timeout):
-        called["url"] = url
-        called["timeout"] = timeout
-
-        class R:
-            status_code = 201
-
-            def json(self):
-                return {}
-
-        return R()
-
-    monkeypatch.setattr(drip_actions, "requests", types.SimpleNamespace(post=fake_post))
-    _set_drip_env(monkeypatch)
+    post_calls = []
+    monkeypatch.setattr(
+        drip_actions,
+        "requests",
+        types.SimpleNamespace(post=_recording_post(post_calls)),
+    )
     drip_actions.bulk_workflow_trigger(["a@example.com", "b@example.com"])
-    assert "url" in called
+    assert len(post_calls) == 1
+    assert post_calls[0]["url"]
 
 
 def test_bulk_workflow_trigger_chunking(monkeypatch, mock_required_settings):
     """Verify >1000 subscribers are chunked into batches of 1000."""
     post_calls = []
-
-    def fake_post(url, headers, data, timeout):
-        post_calls.append(data)
-
-        class R:
-            status_code = 201
-
-            def json(self):
-                return {}
-
-        return R()
-
-    monkeypatch.setattr(drip_actions, "requests", types.SimpleNamespace(post=fake_post))
-    _set_drip_env(monkeypatch)
+    monkeypatch.setattr(
+        drip_actions,
+        "requests",
+        types.SimpleNamespace(post=_recording_post(post_calls)),
+    )
     subs = [f"user{i}@example.com" for i in range(2500)]
     drip_actions.bulk_workflow_trigger(subs)
     assert len(post_calls) == 3  # 1000 + 1000 + 500
@@ -148,17 +127,10 @@ def test_bulk_workflow_trigger_chunking(monkeypatch, mock_required_settings):
 def test_bulk_workflow_trigger_failure(monkeypatch, mock_required_settings, caplog):
     """Verify non-201 status logs an error."""
 
-    def fake_post(url, headers, data, timeout):
-        class R:
-            status_code = 422
-
-            def json(self):
-                return {"errors": [{"code": "invalid", "message": "bad data"}]}
-
-        return R()
-
+    fake_post = _recording_post(
+        [], 422, {"errors": [{"code": "invalid", "message": "bad data"}]}
+    )
     monkeypatch.setattr(drip_actions, "requests", types.SimpleNamespace(post=fake_post))
-    _set_drip_env(monkeypatch)
     with caplog.at_level("ERROR"):
         drip_actions.bulk_workflow_trigger(["a@example.com"])
     assert "Failed to add subscribers" in caplog.text
@@ -167,108 +139,52 @@ def test_bulk_workflow_trigger_failure(monkeypatch, mock_required_settings, capl
 # --- subscriber_list.py ---
 
 
-def test_subscriber_list_success(monkeypatch, mock_required_settings):
-    class FakeResponse:
-        def __init__(self):
-            self._page = 1
+def _page(subscribers, total_pages=1):
+    """Build a stand-in for one page of the Drip subscribers endpoint."""
+    payload = {"subscribers": subscribers, "meta": {"total_pages": total_pages}}
+    return types.SimpleNamespace(json=lambda: payload, raise_for_status=lambda: None)
 
-        def json(self):
-            return {
-                "subscribers": [{"email": "a@example.com"}],
-                "meta": {"total_pages": 1},
-            }
 
-        def raise_for_status(self):
-            pass
+# Shared stub for the common single-page success path
+_SINGLE_PAGE = _page([{"email": "a@example.com"}])
+_SINGLE_PAGE_REQUESTS = types.SimpleNamespace(get=lambda *a, **k: _SINGLE_PAGE)
 
-    monkeypatch.setattr(
-        subscriber_list,
-        "requests",
-        types.SimpleNamespace(get=lambda *a, **k: FakeResponse()),
-    )
-    _set_drip_env(monkeypatch)
+
+def test_subscriber_list_success(monkeypatch, mock_required_settings):
+    monkeypatch.setattr(subscriber_list, "requests", _SINGLE_PAGE_REQUESTS)
     result = subscriber_list.subscriber_list()
     assert result == ["a@example.com"]
 
 
 def test_subscriber_list_multipage(monkeypatch, mock_required_settings):
-    class FakeResponse:
-        def __init__(self, page):
-            self.page = page
-
-        def json(self):
-            if self.page == 1:
-                return {
-                    "subscribers": [{"email": "a@example.com"}],
-                    "meta": {"total_pages": 2},
-                }
-            return {
-                "subscribers": [{"email": "b@example.com"}],
-                "meta": {"total_pages": 2},
-            }
-
-        def raise_for_status(self):
-            pass
-
+    pages = {
+        1: _page([{"email": "a@example.com"}], total_pages=2),
+        2: _page([{"email": "b@example.com"}], total_pages=2),
+    }
     calls = []
 
     def fake_get(url, headers=None, params=None, **kwargs):
         # params["page"] will be 1 for first call, 2 for second
         page = params["page"] if params and "page" in params else 1
         calls.append(page)
-        return FakeResponse(page)
+        return pages[page]
 
     monkeypatch.setattr(
         subscriber_list, "requests", types.SimpleNamespace(get=fake_get)
     )
-    _set_drip_env(monkeypatch)
     result = subscriber_list.subscriber_list()
     assert set(result) == {"a@example.com", "b@example.com"}
     assert calls == [1, 2]
 
-    class FakeSimpleResponse:
-        def __init__(self):
-            self._page = 1
-
-        def json(self):
-            return {
-                "subscribers": [{"email": "a@example.com"}],
-                "meta": {"total_pages": 1},
-            }
-
-        def raise_for_status(self):
-            pass
-
-    monkeypatch.setattr(
-        subscriber_list,
-        "requests",
-        types.SimpleNamespace(get=lambda *a, **k: FakeSimpleResponse()),
-    )
-    result = subscriber_list.subscriber_list()
-    assert result == ["a@example.com"]
-
 
 def test_subscriber_list_returns_full_objects(monkeypatch, mock_required_settings):
     """Verify non-email-only tags return full subscriber dicts."""
-
-    class FakeResponse:
-        def json(self):
-            return {
-                "subscribers": [
-                    {"email": "a@example.com", "tags": ["Daily Start Set"]}
-                ],
-                "meta": {"total_pages": 1},
-            }
-
-        def raise_for_status(self):
-            pass
-
+    response = _page([{"email": "a@example.com", "tags": ["Daily Start Set"]}])
     monkeypatch.setattr(
         subscriber_list,
         "requests",
-        types.SimpleNamespace(get=lambda *a, **k: FakeResponse()),
+        types.SimpleNamespace(get=lambda *a, **k: response),
     )
-    _set_drip_env(monkeypatch)
     result = subscriber_list.subscriber_list(tag="Daily Start Set")
     assert isinstance(result[0], dict)
     assert result[0]["email"] == "a@example.com"
@@ -295,6 +211,5 @@ def test_subscriber_list_failure(monkeypatch, mock_required_settings):
         ),
     )
     monkeypatch.setattr(retry_mod, "sleep", lambda _: None)
-    _set_drip_env(monkeypatch)
     result = subscriber_list.subscriber_list()
     assert result == []
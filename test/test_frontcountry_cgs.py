@@ -1,23 +1,23 @@
 import json
+import types
 from datetime import datetime
 from unittest.mock import patch
 
+import pytest
 import requests
 
 import trails_and_cgs.frontcountry_cgs as cgs_mod
 from shared.data_types import CampgroundsResult
 
 
-def _make_response(rows):
-    """Build a fake requests.Response with the given campground rows."""
-
-    class DummyResp:
-        text = json.dumps({"rows": rows})
+def _response(text):
+    """Build a fake requests.Response with the given body."""
+    return types.SimpleNamespace(text=text, raise_for_status=lambda: None)
 
-        def raise_for_status(self):
-            pass
 
-    return DummyResp()
+def _make_response(rows):
+    """Build a fake requests.Response with the given campground rows."""
+    return _response(json.dumps({"rows": rows}))
 
 
 def _cg(name, status="closed", service_status="", description=""):
@@ -29,6 +29,17 @@ def _cg(name, status="closed", service_status="", description=""):
     }
 
 
+def _serve(monkeypatch, response):
+    """Make every campground API request return the same prebuilt response."""
+    monkeypatch.setattr(cgs_mod.requests, "get", lambda *a, **k: response)
+
+
+# Serialized once at import; shared by the display-month tests
+_BOWMAN_SEASONAL = _make_response(
+    [_cg("Bowman Lake", service_status="Closed for the season")]
+)
+
+
 def _mock_month(month):
     """Return a patcher that pins now_mountain() to the given month."""
     fake = datetime(2026, month, 15, 10, 0, 0)
@@ -45,7 +56,7 @@ def test_hard_floor_january_groups_all_non_year_round(monkeypatch):
         _cg("Many Glacier", service_status="Closed in 2025"),
         _cg("Apgar", service_status="Open for the Season"),
     ]
-    monkeypatch.setattr(cgs_mod.requests, "get", lambda *a, **k: _make_response(rows))
+    _serve(monkeypatch, _make_response(rows))
     with _mock_month(1):
         result = cgs_mod.campground_alerts()
     # Rising Sun and Many Glacier are seasonal; Apgar is year-round → individual
@@ -60,7 +71,7 @@ def test_hard_floor_april_displays_seasonal_line(monkeypatch):
         _cg("Cut Bank", service_status="Open for the Season"),
         _cg("Fish Creek", service_status="Open for the Season"),
     ]
-    monkeypatch.setattr(cgs_mod.requests, "get", lambda *a, **k: _make_response(rows))
+    _serve(monkeypatch, _make_response(rows))
     with _mock_month(4):
         result = cgs_mod.campground_alerts()
     assert any("Not yet open for the season" in s for s in result.statuses)
@@ -74,7 +85,7 @@ def test_case_insensitive_season_match_in_summer(monkeypatch):
         _cg("Sprague Creek", service_status="Closed for the season"),
         _cg("Rising Sun", service_status="Open for the Season"),
     ]
-    monkeypatch.setattr(cgs_mod.requests, "get", lambda *a, **k: _make_response(rows))
+    _serve(monkeypatch, _make_response(rows))
     with _mock_month(5):
         result = cgs_mod.campground_alerts()
     seasonal_line = [s for s in result.statuses if "season" in s.lower()]
@@ -88,7 +99,7 @@ def test_specific_closure_not_grouped_in_summer(monkeypatch):
     rows = [
         _cg("Fish Creek", service_status="Posted for Bear Frequenting"),
     ]
-    monkeypatch.setattr(cgs_mod.requests, "get", lambda *a, **k: _make_response(rows))
+    _serve(monkeypatch, _make_response(rows))
     with _mock_month(7):
         result = cgs_mod.campground_alerts()
     assert any("Fish Creek CG: currently closed" in s for s in result.statuses)
@@ -98,7 +109,7 @@ def test_specific_closure_not_grouped_in_summer(monkeypatch):
 def test_year_round_cg_always_individual(monkeypatch):
     """Year-round campgrounds show individually even without 'season' text."""
     rows = [_cg("St Mary", service_status="some reason")]
-    monkeypatch.setattr(cgs_mod.requests, "get", lambda *a, **k: _make_response(rows))
+    _serve(monkeypatch, _make_response(rows))
     with _mock_month(2):
         result = cgs_mod.campground_alerts()
     assert any("St Mary CG: currently closed" in s for s in result.statuses)
@@ -109,51 +120,35 @@ def test_year_round_cg_always_individual(monkeypatch):
 
 def test_seasonal_line_hidden_in_december(monkeypatch):
     """Dec-Mar: seasonal closures detected but not displayed."""
-    rows = [_cg("Bowman Lake", service_status="Closed for the season")]
-    monkeypatch.setattr(cgs_mod.requests, "get", lambda *a, **k: _make_response(rows))
+    _serve(monkeypatch, _BOWMAN_SEASONAL)
     with _mock_month(12):
         result = cgs_mod.campground_alerts()
     assert result.statuses == []
 
 
-def test_seasonal_line_shown_in_november(monkeypatch):
-    """November: seasonal closures displayed with 'Closed for the season' phrasing."""
-    rows = [_cg("Bowman Lake", service_status="Closed for the season")]
-    monkeypatch.setattr(cgs_mod.requests, "get", lambda *a, **k: _make_response(rows))
-    with _mock_month(11):
+@pytest.mark.parametrize(
+    "month, expected",
+    [
+        # Apr-Jul: 'Not yet open for the season' phrasing
+        pytest.param(6, "Not yet open for the season: ", id="june"),
+        # Aug+: 'Closed for the season' phrasing
+        pytest.param(9, "Closed for the season: ", id="september"),
+        pytest.param(11, "Closed for the season: ", id="november"),
+    ],
+)
+def test_seasonal_line_phrasing(monkeypatch, month, expected):
+    """Seasonal closures use phrasing that depends on the display month."""
+    _serve(monkeypatch, _BOWMAN_SEASONAL)
+    with _mock_month(month):
         result = cgs_mod.campground_alerts()
-    assert any("Closed for the season: Bowman Lake" in s for s in result.statuses)
-
-
-def test_phrasing_not_yet_open_before_august(monkeypatch):
-    """Apr-Jul: uses 'Not yet open for the season' phrasing."""
-    rows = [_cg("Avalanche Creek", service_status="Closed for the season")]
-    monkeypatch.setattr(cgs_mod.requests, "get", lambda *a, **k: _make_response(rows))
-    with _mock_month(6):
-        result = cgs_mod.campground_alerts()
-    assert any("Not yet open for the season" in s for s in result.statuses)
-
-
-def test_phrasing_closed_for_season_aug_onward(monkeypatch):
-    """Aug+: uses 'Closed for the season' phrasing."""
-    rows = [_cg("Avalanche Creek", service_status="Closed for the season")]
-    monkeypatch.setattr(cgs_mod.requests, "get", lambda *a, **k: _make_response(rows))
-    with _mock_month(9):
-        result = cgs_mod.campground_alerts()
-    assert any("Closed for the season" in s for s in result.statuses)
+    assert any(f"{expected}Bowman Lake" in s for s in result.statuses)
 
 
 # --- Error handling ---
 
 
 def test_campground_alerts_down(monkeypatch):
-    class DummyResp:
-        text = "{}"
-
-        def raise_for_status(self):
-            pass
-
-    monkeypatch.setattr(cgs_mod.requests, "get", lambda *a, **k: DummyResp())
+    _serve(monkeypatch, _response("{}"))
     result = cgs_mod.campground_alerts()
     assert isinstance(result, CampgroundsResult)
     assert "currently down" in result.error_message
@@ -189,7 +184,7 @@ def test_notice_extraction(monkeypatch):
             ),
         ),
     ]
-    monkeypatch.setattr(cgs_mod.requests, "get", lambda *a, **k: _make_response(rows))
+    _serve(monkeypatch, _make_response(rows))
     with _mock_month(7):
         result = cgs_mod.campground_alerts()
     assert any("Fish Creek CG:" in s for s in result.statuses)
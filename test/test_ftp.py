@@ -1,6 +1,8 @@
 import ftplib
+import io
+import socket
 from datetime import UTC, datetime
-from unittest.mock import mock_open, patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -8,167 +10,193 @@ import shared.ftp as ftp_mod
 from shared.ftp import FTPSession
 
 
-def _make_delete_ftp(
-    files, sendcmd_response="213 20240101000000", *, dir_names=frozenset()
-):
-    """Create a DummyFTP and deleted-file tracker for delete_on_first tests."""
-    deleted = []
+class DummyFTP:
+    """In-memory stand-in for ftplib.FTP that records the calls it receives.
 
-    class DummyFTP:
-        def nlst(self):
-            return list(files)
+    Without ``mlsd_entries`` the server rejects MLSD, so listing falls back
+    to NLST/SIZE/MDTM over ``files``; names in ``dir_names`` fail SIZE.
+    """
 
-        def size(self, f):
-            if f in dir_names:
-                raise ftplib.error_perm("550 not a file")
-            return 1
+    def __init__(
+        self,
+        files=("file1",),
+        *,
+        mlsd_entries=None,
+        mdtm_response="213 20240101000000",
+        dir_names=frozenset(),
+    ):
+        self.files = list(files)
+        self.mlsd_entries = mlsd_entries
+        self.mdtm_response = mdtm_response
+        self.dir_names = dir_names
+        self.deleted = []
+        self.cwd_calls = []
+        self.blocksizes = []
+        self.nlst_calls = 0
+        self.quit_called = False
 
-        def sendcmd(self, cmd):
-            return sendcmd_response
+    def login(self, u, p):
+        pass
 
-        def delete(self, f):
-            deleted.append(f)
+    def cwd(self, d):
+        self.cwd_calls.append(d)
 
-    return DummyFTP(), deleted
+    def storbinary(self, cmd, f, blocksize=8192):
+        self.blocksizes.append(blocksize)
+
+    def mlsd(self, path="", facts=()):
+        if self.mlsd_entries is None:
+            raise ftplib.error_perm("500 MLSD not understood")
+        yield from self.mlsd_entries
+
+    def nlst(self):
+        self.nlst_calls += 1
+        return list(self.files)
+
+    def size(self, f):
+        if f in self.dir_names:
+            raise ftplib.error_perm("550 not a file")
+        return 1
+
+    def sendcmd(self, cmd):
+        return self.mdtm_response
+
+    def delete(self, f):
+        self.deleted.append(f)
+
+    def rename(self, old_name, new_name):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+# delete_on_first only prunes on the 1st of the month
+_FIRST_OF_MONTH = datetime(2025, 5, 1, tzinfo=UTC)
+_MID_MONTH = datetime(2025, 5, 15, tzinfo=UTC)
+
+
+def _freeze_clock(monkeypatch, moment):
+    """Pin shared.ftp's now_mountain() to ``moment``."""
+    monkeypatch.setattr(ftp_mod, "now_mountain", lambda: moment)
 
 
 def test_delete_on_first(monkeypatch):
-    ftp, deleted = _make_delete_ftp(["file1", "file2"])
-    monkeypatch.setattr(
-        ftp_mod, "now_mountain", lambda: datetime(2025, 5, 1, tzinfo=UTC)
-    )
+    ftp = DummyFTP(["file1", "file2"])
+    _freeze_clock(monkeypatch, _FIRST_OF_MONTH)
     ftp_mod.delete_on_first(ftp)
-    assert deleted == ["file1", "file2"]
+    assert ftp.deleted == ["file1", "file2"]
 
 
 def test_delete_on_first_not_first_of_month(monkeypatch):
     """Should return early on non-1st day without listing files."""
-    called = {"nlst": False}
-
-    class DummyFTP:
-        def nlst(self):
-            called["nlst"] = True
-            return []
-
-    monkeypatch.setattr(
-        ftp_mod, "now_mountain", lambda: datetime(2025, 5, 15, tzinfo=UTC)
-    )
-    ftp_mod.delete_on_first(DummyFTP())
-    assert not called["nlst"]
+    ftp = DummyFTP([])
+    _freeze_clock(monkeypatch, _MID_MONTH)
+    ftp_mod.delete_on_first(ftp)
+    assert ftp.nlst_calls == 0
 
 
 def test_delete_on_first_skips_directories(monkeypatch):
     """Directories (ftplib.error_perm on size()) should be skipped."""
-    ftp, deleted = _make_delete_ftp(
-        ["a_directory", "old_file"], dir_names={"a_directory"}
-    )
-    monkeypatch.setattr(
-        ftp_mod, "now_mountain", lambda: datetime(2025, 5, 1, tzinfo=UTC)
-    )
+    ftp = DummyFTP(["a_directory", "old_file"], dir_names={"a_directory"})
+    _freeze_clock(monkeypatch, _FIRST_OF_MONTH)
     ftp_mod.delete_on_first(ftp)
-    assert "a_directory" not in deleted
-    assert "old_file" in deleted
+    assert "a_directory" not in ftp.deleted
+    assert "old_file" in ftp.deleted
 
 
 def test_delete_on_first_keeps_recent_files(monkeypatch):
     """Files newer than 6 months should not be deleted."""
-    # Date within 6 months of the mocked "today" (2025-05-01)
-    ftp, deleted = _make_delete_ftp(["recent_file"], "213 20250430000000")
-    monkeypatch.setattr(
-        ftp_mod, "now_mountain", lambda: datetime(2025, 5, 1, tzinfo=UTC)
-    )
+    # Date within 6 months of _FIRST_OF_MONTH
+    ftp = DummyFTP(["recent_file"], mdtm_response="213 20250430000000")
+    _freeze_clock(monkeypatch, _FIRST_OF_MONTH)
     ftp_mod.delete_on_first(ftp)
-    assert "recent_file" not in deleted
+    assert "recent_file" not in ftp.deleted
 
 
-@pytest.mark.usefixtures("mock_required_settings")
-class TestFTPSession:
-    """Tests for the FTPSession context manager."""
-
-    def _make_dummy_ftp(self):
-        class DummyFTP:
-            def __init__(self):
-                self.cwd_calls = []
-                self.quit_called = False
-
-            def login(self, u, p):
-                pass
-
-            def cwd(self, d):
-                self.cwd_calls.append(d)
+def test_delete_on_first_uses_mlsd(monkeypatch):
+    ftp = DummyFTP(
+        mlsd_entries=[
+            (".", {"type": "cdir", "modify": "20200101000000"}),
+            ("subdir", {"type": "dir", "modify": "20200101000000"}),
+            ("old_file", {"type": "file", "modify": "20240101000000"}),
+            ("new_file", {"type": "file", "modify": "20250430120000.123"}),
+        ]
+    )
+    _freeze_clock(monkeypatch, _FIRST_OF_MONTH)
+    ftp_mod.delete_on_first(ftp)
+    assert ftp.deleted == ["old_file"]
+    # NLST is only the fallback for servers without MLSD
+    assert ftp.nlst_calls == 0
+
+
+def test_delete_on_first_skips_bad_mlsd_timestamp(monkeypatch):
+    """A malformed MLSD modify fact skips that entry instead of raising."""
+    ftp = DummyFTP(
+        mlsd_entries=[
+            ("truncated", {"type": "file", "modify": "2024"}),
+            ("old_file", {"type": "file", "modify": "20240101000000"}),
+        ]
+    )
+    _freeze_clock(monkeypatch, _FIRST_OF_MONTH)
+    ftp_mod.delete_on_first(ftp)
+    assert ftp.deleted == ["old_file"]
 
-            def storbinary(self, cmd, f):
-                pass
 
-            def nlst(self):
-                return ["file1"]
+def test_delete_on_first_skips_bad_mdtm_reply(monkeypatch):
+    """A garbled MDTM reply skips the file instead of raising."""
+    ftp = DummyFTP(["file1"], mdtm_response="550 not available")
+    _freeze_clock(monkeypatch, _FIRST_OF_MONTH)
+    ftp_mod.delete_on_first(ftp)
+    assert ftp.deleted == []
 
-            def quit(self):
-                self.quit_called = True
 
-            def size(self, f):
-                return 1
+@pytest.fixture
+def dummy_ftp(monkeypatch):
+    """Route FTPSession connections to a DummyFTP on a mid-month day."""
+    dummy = DummyFTP()
+    monkeypatch.setattr(ftp_mod, "FTP", lambda server, timeout=None: dummy)
+    _freeze_clock(monkeypatch, _MID_MONTH)
+    return dummy
 
-            def sendcmd(self, cmd):
-                return "213 20240101000000"
 
-            def delete(self, f):
-                pass
+@pytest.fixture
+def fake_open(monkeypatch):
+    """Serve a small in-memory payload for every local file shared.ftp opens."""
+    monkeypatch.setattr(
+        ftp_mod, "open", lambda *a, **k: io.BytesIO(b"data"), raising=False
+    )
 
-            def rename(self, old_name, new_name):
-                pass
 
-        return DummyFTP()
+@pytest.mark.usefixtures("mock_required_settings")
+class TestFTPSession:
+    """Tests for the FTPSession context manager."""
 
-    def test_session_upload(self, monkeypatch):
+    @pytest.mark.usefixtures("fake_open")
+    def test_session_upload(self, dummy_ftp):
         """Test basic upload through FTPSession."""
-        dummy = self._make_dummy_ftp()
-        monkeypatch.setattr(ftp_mod, "FTP", lambda server: dummy)
-        monkeypatch.setenv("FTP_USERNAME", "u")
-        monkeypatch.setenv("FTP_PASSWORD", "p")
-        monkeypatch.setattr(
-            ftp_mod, "now_mountain", lambda: datetime(2025, 5, 15, tzinfo=UTC)
-        )
-
-        with (
-            FTPSession() as session,
-            patch("builtins.open", mock_open(read_data=b"data")),
-        ):
+        with FTPSession() as session:
             url, files = session.upload("dir", "file.txt", "local.txt")
 
         assert url.startswith("https://glacier.org/")
-        assert "file1" in files
-        assert dummy.quit_called
-
-    def test_session_resets_cwd_to_root(self, monkeypatch):
+        # Listing is not re-fetched after an upload
+        assert files == ["file.txt"]
+        assert dummy_ftp.nlst_calls == 0
+        assert dummy_ftp.quit_called
+        assert dummy_ftp.blocksizes == [ftp_mod._FTP_BLOCKSIZE]
+
+    @pytest.mark.usefixtures("fake_open")
+    def test_session_resets_cwd_to_root(self, dummy_ftp):
         """Test that each upload resets to root before changing directory."""
-        dummy = self._make_dummy_ftp()
-        monkeypatch.setattr(ftp_mod, "FTP", lambda server: dummy)
-        monkeypatch.setenv("FTP_USERNAME", "u")
-        monkeypatch.setenv("FTP_PASSWORD", "p")
-        monkeypatch.setattr(
-            ftp_mod, "now_mountain", lambda: datetime(2025, 5, 15, tzinfo=UTC)
-        )
-
-        with (
-            FTPSession() as session,
-            patch("builtins.open", mock_open(read_data=b"data")),
-        ):
+        with FTPSession() as session:
             session.upload("dir1", "a.txt", "local.txt")
             session.upload("dir2", "b.txt", "local.txt")
 
-        assert dummy.cwd_calls == ["/", "dir1", "/", "dir2"]
+        assert dummy_ftp.cwd_calls == ["/", "dir1", "/", "dir2"]
 
-    def test_delete_on_first_runs_once_per_dir(self, monkeypatch):
+    @pytest.mark.usefixtures("fake_open")
+    def test_delete_on_first_runs_once_per_dir(self, dummy_ftp, monkeypatch):
         """Test that delete_on_first runs only once per directory."""
-        dummy = self._make_dummy_ftp()
-        monkeypatch.setattr(ftp_mod, "FTP", lambda server: dummy)
-        monkeypatch.setenv("FTP_USERNAME", "u")
-        monkeypatch.setenv("FTP_PASSWORD", "p")
-        monkeypatch.setattr(
-            ftp_mod, "now_mountain", lambda: datetime(2025, 5, 15, tzinfo=UTC)
-        )
-
         delete_count = {"count": 0}
 
         def counting_delete(ftp):
@@ -176,43 +204,113 @@ class TestFTPSession:
 
         monkeypatch.setattr(ftp_mod, "delete_on_first", counting_delete)
 
-        with (
-            FTPSession() as session,
-            patch("builtins.open", mock_open(read_data=b"data")),
-        ):
+        with FTPSession() as session:
             session.upload("dir1", "a.txt", "local.txt")
             session.upload("dir1", "b.txt", "local.txt")
             session.upload("dir2", "c.txt", "local.txt")
 
         assert delete_count["count"] == 2
 
-    def test_session_closes_on_exception(self, monkeypatch):
+    def test_session_closes_on_exception(self, dummy_ftp):
         """Test that FTPSession closes connection even on upload error."""
-        dummy = self._make_dummy_ftp()
-        monkeypatch.setattr(ftp_mod, "FTP", lambda server: dummy)
-        monkeypatch.setenv("FTP_USERNAME", "u")
-        monkeypatch.setenv("FTP_PASSWORD", "p")
-        monkeypatch.setattr(
-            ftp_mod, "now_mountain", lambda: datetime(2025, 5, 15, tzinfo=UTC)
-        )
-
         with pytest.raises(RuntimeError), FTPSession() as _session:
             raise RuntimeError("test error")
 
-        assert dummy.quit_called
+        assert dummy_ftp.quit_called
 
-    def test_session_upload_without_file(self, monkeypatch):
+    def test_session_upload_without_file(self, dummy_ftp):
         """Test FTPSession.upload with file=None (list only)."""
-        dummy = self._make_dummy_ftp()
-        monkeypatch.setattr(ftp_mod, "FTP", lambda server: dummy)
-        monkeypatch.setenv("FTP_USERNAME", "u")
-        monkeypatch.setenv("FTP_PASSWORD", "p")
-        monkeypatch.setattr(
-            ftp_mod, "now_mountain", lambda: datetime(2025, 5, 15, tzinfo=UTC)
-        )
-
         with FTPSession() as session:
             url, files = session.upload("dir", "file.txt")
 
         assert url == ""
         assert "file1" in files
+
+    def test_session_closes_socket_when_quit_fails(self, dummy_ftp):
+        """A failed QUIT falls back to close() so the socket is not leaked."""
+        closed = []
+
+        def failing_quit():
+            raise EOFError("connection dropped")
+
+        dummy_ftp.quit = failing_quit
+        dummy_ftp.close = lambda: closed.append(True)
+
+        with FTPSession():
+            pass
+
+        assert closed == [True]
+
+    @pytest.mark.usefixtures("fake_open")
+    def test_session_upload_ftp_error_returns_sentinel(self, dummy_ftp):
+        """FTP/network errors during upload are logged and return empty results."""
+
+        def failing_storbinary(cmd, f, blocksize=8192):
+            raise ftplib.error_temp("421 service not available")
+
+        dummy_ftp.storbinary = failing_storbinary
+
+        with FTPSession() as session:
+            url, files = session.upload("dir", "file.txt", "local.txt")
+
+        assert (url, files) == ("", [])
+
+    @pytest.mark.usefixtures("fake_open")
+    def test_session_upload_unexpected_error_returns_sentinel(self, dummy_ftp, caplog):
+        """Non-FTP errors fail only this file and are logged with a traceback."""
+
+        def broken_storbinary(cmd, f, blocksize=8192):
+            raise TypeError("bad argument")
+
+        dummy_ftp.storbinary = broken_storbinary
+
+        with FTPSession() as session:
+            url, files = session.upload("dir", "file.txt", "local.txt")
+
+        assert (url, files) == ("", [])
+        assert any(r.exc_info for r in caplog.records)
+
+    def test_session_listing_decode_error_returns_sentinel(self, dummy_ftp):
+        """A non-UTF-8 name in the listing does not escape upload()."""
+
+        def undecodable_nlst():
+            raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+        dummy_ftp.nlst = undecodable_nlst
+
+        with FTPSession() as session:
+            url, files = session.upload("dir", "file.txt")
+
+        assert (url, files) == ("", [])
+
+    @pytest.mark.usefixtures("fake_open")
+    def test_session_upload_survives_bad_timestamp(self, dummy_ftp, monkeypatch):
+        """A malformed timestamp during first-of-month cleanup does not fail uploads."""
+        dummy_ftp.mdtm_response = "213 garbage"
+        _freeze_clock(monkeypatch, _FIRST_OF_MONTH)
+
+        with FTPSession() as session:
+            url, files = session.upload("dir", "file.txt", "local.txt")
+
+        assert url == "https://glacier.org/daily/dir/file.txt"
+        assert files == ["file.txt"]
+        assert dummy_ftp.deleted == []
+
+    def test_session_sets_timeout_and_keepalive(self, dummy_ftp, monkeypatch):
+        """The connection gets a socket timeout and TCP keepalive."""
+        dummy_ftp.sock = MagicMock()
+        seen = {}
+
+        def fake_ftp(server, timeout=None):
+            seen["timeout"] = timeout
+            return dummy_ftp
+
+        monkeypatch.setattr(ftp_mod, "FTP", fake_ftp)
+
+        with FTPSession():
+            pass
+
+        assert seen["timeout"] == ftp_mod._FTP_TIMEOUT_SECS
+        dummy_ftp.sock.setsockopt.assert_any_call(
+            socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1
+        )
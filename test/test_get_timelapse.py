@@ -1,7 +1,10 @@
 import json
+import threading
+import time
 from datetime import datetime
 from unittest.mock import Mock, patch
 
+import pytest
 import requests
 
 from sunrise_timelapse.get_timelapse import (
@@ -45,8 +48,15 @@ MOCK_THUMBNAIL_DATA = [
 ]
 
 
+@pytest.fixture
+def mock_get():
+    """Patch the shared timelapse session and yield its ``get`` mock."""
+    session = Mock()
+    with patch("sunrise_timelapse.get_timelapse._get_session", return_value=session):
+        yield session.get
+
+
 class TestFetchGlacierData:
-    @patch("requests.get")
     def test_fetch_timelapse_success(self, mock_get):
         """Test successful timelapse data fetch."""
         mock_response = Mock()
@@ -63,9 +73,8 @@ class TestFetchGlacierData:
             "http://timelapse.glacierconservancy.org/daily_timelapse_data.json"
             in args[0]
         )
-        assert "User-Agent" in kwargs["headers"]
+        assert kwargs["timeout"] == 10
 
-    @patch("requests.get")
     def test_fetch_thumbnail_success(self, mock_get):
         """Test successful thumbnail data fetch."""
         mock_response = Mock()
@@ -81,14 +90,70 @@ class TestFetchGlacierData:
         assert (
             "http://timelapse.glacierconservancy.org/sunrise_thumbnails.json" in args[0]
         )
-        assert "User-Agent" in kwargs["headers"]
+        assert kwargs["timeout"] == 10
+
+    def test_session_is_shared_and_sets_user_agent(self, tmp_path, monkeypatch):
+        from sunrise_timelapse.get_timelapse import _build_session, _get_session
+
+        monkeypatch.chdir(tmp_path)
+        _build_session.cache_clear()
+        try:
+            session = _get_session()
+            assert _get_session() is session
+            assert "Mozilla" in session.headers["User-Agent"]
+            assert session.headers["Pragma"] == "no-cache"
+        finally:
+            _build_session.cache_clear()
+
+    def test_session_created_once_under_concurrent_first_use(self):
+        from sunrise_timelapse.get_timelapse import _build_session, _get_session
+
+        barrier = threading.Barrier(2, timeout=5)
+        created = []
+
+        def slow_session(*args, **kwargs):
+            created.append(args)
+            time.sleep(0.05)  # widen the window for a second builder
+            return Mock()
+
+        _build_session.cache_clear()
+        try:
+            with patch(
+                "sunrise_timelapse.get_timelapse.requests_cache.CachedSession",
+                side_effect=slow_session,
+            ):
+                sessions = []
+
+                def worker():
+                    barrier.wait()
+                    sessions.append(_get_session())
+
+                threads = [threading.Thread(target=worker) for _ in range(2)]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+        finally:
+            _build_session.cache_clear()
+
+        assert len(created) == 1
+        assert sessions[0] is sessions[1]
+
+    def test_fetch_url_has_no_cache_buster(self, mock_get):
+        mock_get.return_value.json.return_value = MOCK_TIMELAPSE_DATA
+
+        fetch_glacier_data("timelapse")
+
+        args, _ = mock_get.call_args
+        assert args[0] == (
+            "http://timelapse.glacierconservancy.org/daily_timelapse_data.json"
+        )
 
     def test_fetch_invalid_endpoint(self):
         """Test handling of invalid endpoint type."""
         result = fetch_glacier_data("invalid")
         assert result == []
 
-    @patch("requests.get")
     def test_fetch_request_exception(self, mock_get):
         """Test handling of request exceptions."""
         mock_get.side_effect = requests.RequestException("Network error")
@@ -97,7 +162,6 @@ class TestFetchGlacierData:
 
         assert result == []
 
-    @patch("requests.get")
     def test_fetch_timeout(self, mock_get):
         """Test handling of timeout."""
         mock_get.side_effect = requests.Timeout("Request timeout")
@@ -106,7 +170,6 @@ class TestFetchGlacierData:
 
         assert result == []
 
-    @patch("requests.get")
     def test_fetch_json_decode_error(self, mock_get):
         """Test handling of JSON decode errors."""
         mock_response = Mock()
@@ -213,6 +276,18 @@ class TestFindMatchingThumbnail:
 
         assert result is None
 
+    def test_find_matching_thumbnail_requires_exact_filename(self):
+        """1_8 must not match 11_8 just because it is a substring."""
+        data = [
+            {"date": "2025-01-11 07:19:30"},
+            {"path": "/daily/sunrise_still/11_8_2025_sunrise.jpg"},
+            {"path": "/daily/sunrise_still/1_8_2025_sunrise.jpg"},
+        ]
+
+        result = find_matching_thumbnail("1_8_2025_sunrise_timelapse", data)
+
+        assert result == "https://glacier.org/daily/sunrise_still/1_8_2025_sunrise.jpg"
+
     def test_find_matching_thumbnail_empty_data(self):
         """Test handling empty thumbnail data."""
         result = find_matching_thumbnail("8_20_2025_sunrise_timelapse", {})
@@ -373,3 +448,26 @@ class TestProcessVideo:
         result = process_video()
 
         assert result == ("", "", "")
+
+    @patch("sunrise_timelapse.get_timelapse.fetch_glacier_data")
+    def test_process_video_fetches_concurrently(self, mock_fetch_data):
+        """Both indexes are requested in parallel, not one after the other."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch_side_effect(endpoint_type):
+            barrier.wait()  # Deadlocks (and times out) if run sequentially
+            if endpoint_type == "timelapse":
+                return MOCK_TIMELAPSE_DATA
+            return MOCK_THUMBNAIL_DATA
+
+        mock_fetch_data.side_effect = fetch_side_effect
+
+        with patch(
+            "sunrise_timelapse.get_timelapse.now_mountain",
+            return_value=datetime(2025, 8, 20, 8, 0),
+        ):
+            result = process_video()
+
+        assert result[1] == (
+            "https://glacier.org/daily/sunrise_still/8_20_2025_sunrise.jpg"
+        )
@@ -2,12 +2,17 @@
 
 import logging
 import logging.handlers
+import os
+import sys
 
 import pytest
 
 from shared.logging_config import (
+    LOG_DATEFMT,
+    LOG_FORMAT,
     MAX_LOG_LINES,
     RunLogCapture,
+    RunLogFormatter,
     get_log_capture,
     get_logger,
     reset_log_capture,
@@ -52,6 +57,38 @@ def test_setup_logging_production(monkeypatch, tmp_path):
     assert stderr_handlers[0].level == logging.ERROR
 
 
+@pytest.mark.skipif(
+    os.name != "posix", reason="WatchedFileHandler rotation is POSIX-only"
+)
+def test_setup_logging_production_external_rotation(monkeypatch, tmp_path):
+    monkeypatch.setenv("ENVIRONMENT", "production")
+    monkeypatch.setenv("LOG_ROTATION", "external")
+    monkeypatch.chdir(tmp_path)
+    setup_logging()
+    root = logging.getLogger()
+    assert any(
+        isinstance(h, logging.handlers.WatchedFileHandler) for h in root.handlers
+    )
+    assert not any(
+        isinstance(h, logging.handlers.RotatingFileHandler) for h in root.handlers
+    )
+
+
+def test_setup_logging_external_rotation_falls_back_off_posix(monkeypatch, tmp_path):
+    monkeypatch.setenv("ENVIRONMENT", "production")
+    monkeypatch.setenv("LOG_ROTATION", "external")
+    monkeypatch.setattr("shared.logging_config._EXTERNAL_ROTATION_SUPPORTED", False)
+    monkeypatch.chdir(tmp_path)
+    setup_logging()
+    root = logging.getLogger()
+    assert any(
+        isinstance(h, logging.handlers.RotatingFileHandler) for h in root.handlers
+    )
+    assert not any(
+        isinstance(h, logging.handlers.WatchedFileHandler) for h in root.handlers
+    )
+
+
 def test_setup_logging_clears_existing_handlers(monkeypatch):
     monkeypatch.setenv("ENVIRONMENT", "development")
     root = logging.getLogger()
@@ -68,15 +105,15 @@ def test_get_logger_returns_logger():
     assert logger.name == "test_module"
 
 
-def test_run_id_filter_on_handlers(monkeypatch):
-    """RunIdFilter must be on each handler so child loggers get run_id injected."""
-    from shared.run_context import RunIdFilter
+def test_setup_logging_installs_run_id_factory(monkeypatch):
+    """run_id is stamped by the LogRecord factory, not per-handler filters."""
+    from shared.run_context import _run_id_record_factory
 
     monkeypatch.setenv("ENVIRONMENT", "development")
     setup_logging()
-    root = logging.getLogger()
-    for handler in root.handlers:
-        assert any(isinstance(f, RunIdFilter) for f in handler.filters)
+    assert logging.getLogRecordFactory() is _run_id_record_factory
+    for handler in logging.getLogger().handlers:
+        assert handler.filters == []
 
 
 def test_child_logger_formats_run_id(monkeypatch):
@@ -84,7 +121,7 @@ def test_child_logger_formats_run_id(monkeypatch):
     from shared.run_context import start_run
 
     monkeypatch.setenv("ENVIRONMENT", "development")
-    start_run("email")
+    run = start_run("email")
     setup_logging()
 
     child = logging.getLogger("test.child.logger")
@@ -93,16 +130,45 @@ def test_child_logger_formats_run_id(monkeypatch):
     record = child.makeRecord(
         "test.child.logger", logging.INFO, "", 0, "hello", (), None
     )
-    # The handler's filter should inject run_id
-    handler.filter(record)
-    assert hasattr(record, "run_id")
-    assert record.run_id != "no-run"
+    assert record.run_id == run.run_id
     # Formatting should not raise
     formatted = handler.format(record)
-    assert "[" in formatted
+    assert f"[{run.run_id}]" in formatted
     assert "test.child.logger" in formatted
 
 
+class TestRunLogFormatter:
+    @staticmethod
+    def _record(exc_info=None):
+        record = logging.LogRecord(
+            "test.fmt", logging.WARNING, "", 0, "value=%d", (42,), exc_info
+        )
+        record.run_id = "abc12345"
+        return record
+
+    def test_matches_stdlib_formatter(self):
+        record = self._record()
+        expected = logging.Formatter(LOG_FORMAT, LOG_DATEFMT).format(record)
+        assert RunLogFormatter().format(self._record()) == expected
+        assert "[abc12345] test.fmt - WARNING - value=42" in expected
+
+    def test_matches_stdlib_formatter_with_exception(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            exc_info = sys.exc_info()
+        expected = logging.Formatter(LOG_FORMAT, LOG_DATEFMT).format(
+            self._record(exc_info=exc_info)
+        )
+        actual = RunLogFormatter().format(self._record(exc_info=exc_info))
+        assert actual == expected
+        assert "ValueError: boom" in actual
+
+    def test_missing_run_id_defaults(self):
+        record = logging.LogRecord("t", logging.INFO, "", 0, "m", (), None)
+        assert "[no-run]" in RunLogFormatter().format(record)
+
+
 class TestRunLogCapture:
     def test_capture_handler_created_by_setup(self, monkeypatch):
         monkeypatch.setenv("ENVIRONMENT", "development")
@@ -146,6 +212,16 @@ class TestRunLogCapture:
         assert len(capture.buffer) == MAX_LOG_LINES + 1  # +1 for truncation sentinel
         assert "truncated" in capture.buffer[-1]
 
+    def test_capture_skips_formatting_once_full(self, monkeypatch):
+        capture = RunLogCapture()
+        capture.buffer = ["x"] * (MAX_LOG_LINES + 1)
+        record = logging.LogRecord("test", logging.INFO, "", 0, "late", (), None)
+        monkeypatch.setattr(
+            capture, "format", lambda r: pytest.fail("format called after cap")
+        )
+        capture.emit(record)
+        assert len(capture.buffer) == MAX_LOG_LINES + 1
+
     def test_reset_log_capture(self, monkeypatch):
         monkeypatch.setenv("ENVIRONMENT", "development")
         setup_logging()
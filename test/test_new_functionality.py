@@ -246,7 +246,9 @@ class TestSleepToSunriseMaxTimeout:
         # Return a time exceeding MAX_WAIT_SECONDS
         monkeypatch.setattr(sts, "sunrise_timelapse_complete_time", lambda: 4 * 60 * 60)
         slept = {}
-        monkeypatch.setattr(sts, "sleep", lambda t: slept.setdefault("time", t))
+        monkeypatch.setattr(
+            sts._wake, "wait", lambda timeout: slept.setdefault("time", timeout)
+        )
 
         sts.sleep_time()
         assert "time" not in slept  # Should NOT have slept
@@ -256,7 +258,9 @@ class TestSleepToSunriseMaxTimeout:
 
         monkeypatch.setattr(sts, "sunrise_timelapse_complete_time", lambda: 100)
         slept = {}
-        monkeypatch.setattr(sts, "sleep", lambda t: slept.setdefault("time", t))
+        monkeypatch.setattr(
+            sts._wake, "wait", lambda timeout: slept.setdefault("time", timeout)
+        )
 
         sts.sleep_time()
         assert slept["time"] == 100
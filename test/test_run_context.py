@@ -2,7 +2,13 @@
 
 import logging
 
-from shared.run_context import RunContext, RunIdFilter, get_run, reset_run, start_run
+from shared.run_context import (
+    RunContext,
+    get_run,
+    install_run_id_factory,
+    reset_run,
+    start_run,
+)
 
 
 class TestRunContext:
@@ -53,35 +59,25 @@ class TestResetRun:
         assert get_run() is None
 
 
-class TestRunIdFilter:
-    def test_filter_injects_run_id(self):
+class TestRunIdRecordFactory:
+    def test_factory_injects_run_id(self):
+        install_run_id_factory()
         start_run("email")
-        filt = RunIdFilter()
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="test",
-            args=(),
-            exc_info=None,
+        record = logging.getLogger("test").makeRecord(
+            "test", logging.INFO, "", 0, "test", (), None
         )
-        result = filt.filter(record)
-        assert result is True
-        assert hasattr(record, "run_id")
         assert record.run_id == get_run().run_id
 
-    def test_filter_without_run_context(self):
+    def test_factory_without_run_context(self):
+        install_run_id_factory()
         reset_run()
-        filt = RunIdFilter()
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="test",
-            args=(),
-            exc_info=None,
+        record = logging.getLogger("test").makeRecord(
+            "test", logging.INFO, "", 0, "test", (), None
         )
-        filt.filter(record)
         assert record.run_id == "no-run"
+
+    def test_install_is_idempotent(self):
+        install_run_id_factory()
+        factory = logging.getLogRecordFactory()
+        install_run_id_factory()
+        assert logging.getLogRecordFactory() is factory
@@ -1,10 +1,13 @@
 """Tests for shared.run_report module."""
 
+import dataclasses
 import json
 import logging
 import os
 from datetime import timedelta
 
+import pytest
+
 from shared.datetime_utils import now_mountain
 from shared.logging_config import get_logger, setup_logging
 from shared.run_context import start_run
@@ -30,6 +33,10 @@ class TestRunReport:
         assert d["overall_status"] == "partial"
         assert isinstance(d["modules"], dict)
 
+    def test_to_dict_covers_all_fields(self):
+        report = RunReport(errors=["x"], log_lines=["line"])
+        assert report.to_dict() == dataclasses.asdict(report)
+
     def test_default_status_is_success(self):
         report = RunReport()
         assert report.overall_status == "success"
@@ -383,3 +390,40 @@ class TestUploadStatusReport:
             data = json.load(f)
         assert len(data["runs"]) == 1
         assert data["runs"][0]["run_id"] == "fresh"
+
+    def test_skips_write_when_unchanged(self, tmp_path, monkeypatch):
+        status_file = str(tmp_path / "status.json")
+        monkeypatch.setattr("shared.run_report.STATUS_FILE", status_file)
+
+        upload_status_report(
+            RunReport(run_id="first", end_time=now_mountain().isoformat())
+        )
+        mtime = os.stat(status_file).st_mtime_ns
+
+        # A stale run is trimmed immediately, leaving history unchanged
+        upload_status_report(RunReport(run_id="stale", end_time="2020-01-01"))
+
+        assert os.stat(status_file).st_mtime_ns == mtime
+        with open(status_file, encoding="utf-8") as f:
+            data = json.load(f)
+        assert [r["run_id"] for r in data["runs"]] == ["first"]
+
+    def test_write_is_atomic(self, tmp_path, monkeypatch):
+        status_file = str(tmp_path / "status.json")
+        monkeypatch.setattr("shared.run_report.STATUS_FILE", status_file)
+        with open(status_file, "w", encoding="utf-8") as f:
+            json.dump({"runs": []}, f)
+
+        def fail_replace(src, dst):
+            raise OSError("simulated crash")
+
+        monkeypatch.setattr("shared.run_report.os.replace", fail_replace)
+        report = RunReport(run_id="new", end_time=now_mountain().isoformat())
+        with pytest.raises(OSError, match="simulated crash"):
+            upload_status_report(report)
+
+        # The original file is untouched when the swap never happens
+        with open(status_file, encoding="utf-8") as f:
+            assert json.load(f) == {"runs": []}
+        # ...and the temp file is cleaned up rather than left beside it
+        assert not os.path.exists(f"{status_file}.tmp")
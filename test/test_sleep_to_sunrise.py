@@ -1,3 +1,4 @@
+import time
 from datetime import date, datetime
 from unittest.mock import MagicMock
 
@@ -11,24 +12,45 @@ def test_sunrise_timelapse_complete_time(monkeypatch):
     mock_sun = MagicMock()
     mock_sun.sun.return_value = {"sunrise": sunrise}
     monkeypatch.setattr(sts, "sun", mock_sun)
+    monkeypatch.setattr(sts, "now_mountain", lambda: now)
+    sts._sun_times.cache_clear()
 
-    mock_dt = MagicMock()
-    mock_dt.now.return_value = now
-    monkeypatch.setattr(sts, "datetime", mock_dt)
+    result = sts.sunrise_timelapse_complete_time()
+    assert result == 6720.0  # 1 hour to sunrise + 52 min buffer
+    sts._sun_times.cache_clear()
 
-    mock_date = MagicMock()
-    mock_date.today.return_value = date(2025, 5, 28)
-    monkeypatch.setattr(sts, "date", mock_date)
 
-    monkeypatch.setattr(sts, "ZoneInfo", lambda tz: None)
+def test_sun_times_cached_per_day(monkeypatch):
+    mock_sun = MagicMock()
+    mock_sun.sun.return_value = {"sunrise": datetime(2025, 5, 28, 6, 0, 0)}
+    monkeypatch.setattr(sts, "sun", mock_sun)
+    sts._sun_times.cache_clear()
 
-    result = sts.sunrise_timelapse_complete_time()
-    assert result == 6720.0  # 1 hour to sunrise + 52 min buffer
+    sts._sun_times(date(2025, 5, 28))
+    sts._sun_times(date(2025, 5, 28))
+    sts._sun_times(date(2025, 5, 29))
+    assert mock_sun.sun.call_count == 2
+    sts._sun_times.cache_clear()
 
 
 def test_sleep_time_waits(monkeypatch):
     called = {}
     monkeypatch.setattr(sts, "sunrise_timelapse_complete_time", lambda: 0.1)
-    monkeypatch.setattr(sts, "sleep", lambda t: called.setdefault("slept", t))
+    monkeypatch.setattr(
+        sts._wake, "wait", lambda timeout: called.setdefault("slept", timeout)
+    )
     sts.sleep_time()
     assert called["slept"] == 0.1
+
+
+def test_cancel_sleep_wakes_early(monkeypatch, caplog):
+    monkeypatch.setattr(sts, "sunrise_timelapse_complete_time", lambda: 60.0)
+    # Cancelling before the wait starts must still skip the sleep
+    sts.cancel_sleep()
+    start = time.monotonic()
+    with caplog.at_level("INFO"):
+        sts.sleep_time()
+    assert time.monotonic() - start < 5
+    assert "Sleep cancelled" in caplog.text
+    # The wake event is reset so the next run sleeps normally
+    assert not sts._wake.is_set()
@@ -210,3 +210,15 @@ class TestGetTiming:
         reset_timing()
         t2 = get_timing()
         assert t1 is not t2
+
+
+def test_timed_measures_with_perf_counter(monkeypatch):
+    ticks = iter([1_000_000_000, 3_500_000_000])
+    monkeypatch.setattr("shared.timing.time.perf_counter_ns", lambda: next(ticks))
+
+    @timed("clocked")
+    def noop():
+        return None
+
+    noop()
+    assert get_timing().modules["clocked"].duration_seconds == 2.5